@@ -58,6 +58,14 @@ LESSON_PATTERN = re.compile(
     r"[-*]\s*(?:Leçon|Lesson)\s*:\s*(.+)",
     re.IGNORECASE,
 )
+CATEGORY_PATTERN = re.compile(
+    r"(CC-FAIL|WRONG-ASSUMPTION|CONTEXT-LOSS|HALLUCINATION|"
+    r"ARCH-MISTAKE|PROCESS-SKIP)"
+)
+
+# Dates YYYY-MM-DD (éventuellement entre crochets) dans les lignes mémoire
+DATE_PATTERN = re.compile(r"\[?(\d{4}-\d{2}-\d{2})\]?")
+DATE_PREFIX_PATTERN = re.compile(r"^\[?\d{4}-\d{2}-\d{2}\]?\s*")
 
 
 # ── Data classes ──────────────────────────────────────────────────────────────
@@ -182,7 +190,7 @@ def _get_project_name(project_root: Path) -> str:
 
 def _parse_date_from_line(line: str) -> str:
     """Extrait une date YYYY-MM-DD depuis une ligne."""
-    match = re.search(r'\[?(\d{4}-\d{2}-\d{2})\]?', line)
+    match = DATE_PATTERN.search(line)
     return match.group(1) if match else ""
 
 
@@ -206,8 +214,7 @@ def export_learnings(project_root: Path,
                     date = _parse_date_from_line(line)
                     if since and date and date < since:
                         continue
-                    text = re.sub(r'^\[?\d{4}-\d{2}-\d{2}\]?\s*', '',
-                                  line.lstrip("- *").strip())
+                    text = DATE_PREFIX_PATTERN.sub("", line.lstrip("- *").strip())
                     if text:
                         results.append(ExportedLearning(
                             agent=agent, text=text, date=date))
@@ -254,10 +261,7 @@ def export_rules(project_root: Path,
             current_rule = ""
             current_lesson = ""
             # Extract category
-            cat_match = re.search(
-                r'(CC-FAIL|WRONG-ASSUMPTION|CONTEXT-LOSS|HALLUCINATION|'
-                r'ARCH-MISTAKE|PROCESS-SKIP)',
-                line)
+            cat_match = CATEGORY_PATTERN.search(line)
             current_category = cat_match.group(1) if cat_match else "UNKNOWN"
 
         if in_entry:
@@ -85,6 +85,17 @@ class DNASnapshot:
 
 # ── Parsing DNA YAML (minimal, sans dépendances) ─────────────────────────────
 
+# Regex compilées une fois : parse_dna est appelé pour chaque archétype
+_DNA_ID_RE = re.compile(r"^id:\s*['\"]?([^'\"\n]+)['\"]?", re.MULTILINE)
+_DNA_VERSION_RE = re.compile(r"^version:\s*['\"]?([^'\"\n]+)['\"]?", re.MULTILINE)
+_DNA_TOOLS_SECTION_RE = re.compile(r"tools_required:\s*\n((?:(?:  - |\s{4,}).*\n)*)")
+_DNA_TRAITS_SECTION_RE = re.compile(r"^traits:\s*\n((?:\s+-.*\n(?:\s+\S.*\n)*)*)", re.MULTILINE)
+_DNA_CONSTRAINTS_SECTION_RE = re.compile(r"^constraints:\s*\n((?:\s+-.*\n(?:\s+\S.*\n)*)*)", re.MULTILINE)
+_DNA_VALUES_SECTION_RE = re.compile(r"^values:\s*\n((?:\s+-.*\n(?:\s+\S.*\n)*)*)", re.MULTILINE)
+_DNA_NAME_RE = re.compile(r"name:\s*['\"]?([^'\"\n]+)['\"]?")
+_DNA_ITEM_ID_RE = re.compile(r"id:\s*['\"]?([^'\"\n]+)['\"]?")
+
+
 def parse_dna(dna_path: Path) -> DNASnapshot:
     """Parse minimalement un fichier archetype.dna.yaml."""
     if not dna_path.exists():
@@ -94,33 +105,33 @@ def parse_dna(dna_path: Path) -> DNASnapshot:
     snap = DNASnapshot(source_path=dna_path, archetype_id="unknown", version="1.0.0", raw_content=raw)
 
     # Extraire archetype_id
-    m = re.search(r"^id:\s*['\"]?([^'\"\n]+)['\"]?", raw, re.MULTILINE)
+    m = _DNA_ID_RE.search(raw)
     if m:
         snap.archetype_id = m.group(1).strip()
 
-    m = re.search(r"^version:\s*['\"]?([^'\"\n]+)['\"]?", raw, re.MULTILINE)
+    m = _DNA_VERSION_RE.search(raw)
     if m:
         snap.version = m.group(1).strip()
 
     # Extraire tools (name: sous tools_required:)
-    tools_section = re.search(r"tools_required:\s*\n((?:(?:  - |\s{4,}).*\n)*)", raw)
+    tools_section = _DNA_TOOLS_SECTION_RE.search(raw)
     if tools_section:
-        snap.tools = re.findall(r"name:\s*['\"]?([^'\"\n]+)['\"]?", tools_section.group(0))
+        snap.tools = _DNA_NAME_RE.findall(tools_section.group(0))
 
     # Extraire traits (name: dans la section traits:)
-    traits_section = re.search(r"^traits:\s*\n((?:\s+-.*\n(?:\s+\S.*\n)*)*)", raw, re.MULTILINE)
+    traits_section = _DNA_TRAITS_SECTION_RE.search(raw)
     if traits_section:
-        snap.traits = re.findall(r"name:\s*['\"]?([^'\"\n]+)['\"]?", traits_section.group(0))
+        snap.traits = _DNA_NAME_RE.findall(traits_section.group(0))
 
     # Extraire constraints
-    constraints_section = re.search(r"^constraints:\s*\n((?:\s+-.*\n(?:\s+\S.*\n)*)*)", raw, re.MULTILINE)
+    constraints_section = _DNA_CONSTRAINTS_SECTION_RE.search(raw)
     if constraints_section:
-        snap.constraints = re.findall(r"id:\s*['\"]?([^'\"\n]+)['\"]?", constraints_section.group(0))
+        snap.constraints = _DNA_ITEM_ID_RE.findall(constraints_section.group(0))
 
     # Extraire values
-    values_section = re.search(r"^values:\s*\n((?:\s+-.*\n(?:\s+\S.*\n)*)*)", raw, re.MULTILINE)
+    values_section = _DNA_VALUES_SECTION_RE.search(raw)
     if values_section:
-        snap.values = re.findall(r"name:\s*['\"]?([^'\"\n]+)['\"]?", values_section.group(0))
+        snap.values = _DNA_NAME_RE.findall(values_section.group(0))
 
     return snap
 
@@ -197,6 +208,14 @@ BEHAVIORAL_PATTERNS = {
     "semantic-search": (r"qdrant|semantic|vector|embedding", "Recherche sémantique active"),
 }
 
+# Compilés une fois : analyze_trace teste chaque ligne contre chaque outil
+_COMPILED_TOOL_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE) for name, pattern in KNOWN_TOOLS_PATTERNS.items()
+}
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_AGENT_RE = re.compile(r"\[AGENT:([^\]]+)\]|agent:\s*([a-z-]+)", re.IGNORECASE)
+
+
 def analyze_trace(
     trace_path: Path,
     since: str | None = None,
@@ -222,7 +241,7 @@ def analyze_trace(
             filtered_lines = []
             include = False
             for line in lines:
-                dm = re.search(r"\d{4}-\d{2}-\d{2}", line)
+                dm = _DATE_RE.search(line)
                 if dm:
                     try:
                         line_dt = datetime.fromisoformat(dm.group(0))
@@ -240,19 +259,19 @@ def analyze_trace(
 
     for line in lines:
         # Détecter l'agent actif
-        agent_m = re.search(r"\[AGENT:([^\]]+)\]|agent:\s*([a-z-]+)", line, re.IGNORECASE)
+        agent_m = _AGENT_RE.search(line)
         if agent_m:
             current_agent = (agent_m.group(1) or agent_m.group(2) or current_agent).strip()
 
         # Détecter les outils
-        for tool_name, pattern in KNOWN_TOOLS_PATTERNS.items():
-            if re.search(pattern, line, re.IGNORECASE):
+        for tool_name, pattern in _COMPILED_TOOL_PATTERNS.items():
+            if pattern.search(line):
                 if tool_name not in tools:
                     tools[tool_name] = ObservedTool(name=tool_name)
                 tools[tool_name].count += 1
                 tools[tool_name].agents.add(current_agent)
                 # Mémorise la date de dernière utilisation
-                date_m = re.search(r"\d{4}-\d{2}-\d{2}", line)
+                date_m = _DATE_RE.search(line)
                 if date_m:
                     tools[tool_name].last_seen = date_m.group(0)
 
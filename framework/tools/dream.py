@@ -21,10 +21,14 @@ Stdlib only — aucune dépendance externe.
 """
 
 import argparse
+import functools
 import json
 import math
+import os
 import re
 import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -40,11 +44,13 @@ PERSISTENCE_BOOST = 0.15   # Bonus confiance pour insight persistant
 DECAY_HALFLIFE_DAYS = 14   # Demi-vie pour la pondération temporelle
 DREAM_MEMORY_FILE = "dream-memory.json"  # Historique structuré des insights
 MAX_OPPORTUNITIES_PER_SOURCE = 3  # Cap par source pour éviter la saturation
+PARALLEL_PARSE_MIN_FILES = 4      # En dessous, lecture séquentielle (pool non rentable)
+INDEX_MIN_ENTRIES = 32            # Au-delà, index inversé pour les connexions croisées
 
 
 # ── Data classes ──────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class DreamSource:
     """Une source de données pour le dream."""
     name: str          # ex. "learnings/dev.md"
@@ -53,7 +59,7 @@ class DreamSource:
     dates: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DreamInsight:
     """Un insight émergent produit par le dream."""
     title: str
@@ -72,14 +78,21 @@ def collect_sources(project_root: Path, since: str | None = None,
     """Collecte toutes les sources de mémoire du projet."""
     sources: list[DreamSource] = []
     memory_dir = project_root / "_bmad" / "_memory"
+    agent_key = agent_filter.lower() if agent_filter else ""
 
-    # 1. Learnings
+    # 1. Learnings — fichiers filtrés sur leur nom, avant toute lecture
     learnings_dir = memory_dir / "agent-learnings"
     if learnings_dir.exists():
-        for f in sorted(learnings_dir.glob("*.md")):
-            if agent_filter and agent_filter.lower() not in f.stem.lower():
-                continue
-            entries = _parse_markdown_entries(f, since)
+        files = [f for f in sorted(learnings_dir.glob("*.md"))
+                 if not agent_key or agent_key in f.stem.lower()]
+        parse = functools.partial(_parse_markdown_entries, since=since)
+        if len(files) >= PARALLEL_PARSE_MIN_FILES:
+            # Lectures en parallèle (l'IO libère le GIL) ; map préserve l'ordre
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+                parsed = list(ex.map(parse, files))
+        else:
+            parsed = [parse(f) for f in files]
+        for f, entries in zip(files, parsed):
             if entries:
                 sources.append(DreamSource(
                     name=f"learnings/{f.name}",
@@ -161,27 +174,49 @@ def collect_sources(project_root: Path, since: str | None = None,
     return sources
 
 
-def _parse_markdown_entries(path: Path, since: str | None = None) -> list[tuple[str, str]]:
-    """Parse un fichier markdown et retourne [(date, text), ...]."""
+_DATE_PATTERN = re.compile(r'\[(\d{4}-\d{2}-\d{2})')
+_TRACE_PATTERN = re.compile(
+    r'\[(\d{4}-\d{2}-\d{2})[^\]]*\]\s*\[(\w+)\]\s*\[([^\]]+)\]\s*(.*)'
+)
+
+
+def _parse_source(path: Path, parse: Callable[..., list[tuple[str, str]]],
+                  *args) -> list[tuple[str, str]]:
+    """Applique parse aux lignes d'une source lue en flux, sans la charger d'un bloc.
+
+    Retourne [] si la source est absente, illisible ou vide ; un fichier vide
+    est détecté par os.stat, sans l'ouvrir.
+    """
     try:
-        content = path.read_text(encoding="utf-8")
+        if os.stat(path).st_size == 0:
+            return []
+        with open(path, encoding="utf-8") as f:
+            return parse(f, *args)
     except OSError:
         return []
 
+
+def _parse_markdown_entries(path: Path, since: str | None = None) -> list[tuple[str, str]]:
+    """Parse un fichier markdown et retourne [(date, text), ...]."""
+    return _parse_source(path, _parse_markdown_lines, since)
+
+
+def _parse_markdown_lines(lines: Iterable[str],
+                          since: str | None = None) -> list[tuple[str, str]]:
+    """Parse des lignes markdown déjà lues et retourne [(date, text), ...]."""
     entries: list[tuple[str, str]] = []
-    date_pattern = re.compile(r'\[(\d{4}-\d{2}-\d{2})')
 
-    for line in content.splitlines():
+    for line in lines:
         line = line.strip()
-        if not line or line.startswith("#"):
+        # Seules les puces comptent : titres, blancs et prose sont écartés avant la regex
+        if not (line.startswith("- ") or line.startswith("* ")):
             continue
         # Chercher une date dans la ligne
-        match = date_pattern.search(line)
+        match = _DATE_PATTERN.search(line)
         entry_date = match.group(1) if match else ""
         if since and entry_date and entry_date < since:
             continue
-        if line.startswith("- ") or line.startswith("* "):
-            entries.append((entry_date, line[2:].strip()))
+        entries.append((entry_date, line[2:].strip()))
 
     return entries
 
@@ -189,24 +224,27 @@ def _parse_markdown_entries(path: Path, since: str | None = None) -> list[tuple[
 def _parse_trace_entries(path: Path, since: str | None = None,
                          agent_filter: str | None = None) -> list[tuple[str, str]]:
     """Parse BMAD_TRACE.md pour les entrées pertinentes."""
-    try:
-        content = path.read_text(encoding="utf-8")
-    except OSError:
-        return []
+    return _parse_source(path, _parse_trace_lines, since, agent_filter)
+
 
+def _parse_trace_lines(lines: Iterable[str], since: str | None = None,
+                       agent_filter: str | None = None) -> list[tuple[str, str]]:
+    """Parse des lignes de trace déjà lues (DECISION, CHECKPOINT, FAILURE, REMEMBER)."""
     entries: list[tuple[str, str]] = []
-    trace_pattern = re.compile(
-        r'\[(\d{4}-\d{2}-\d{2})[^\]]*\]\s*\[(\w+)\]\s*\[([^\]]+)\]\s*(.*)'
-    )
+    agent_key = agent_filter.lower() if agent_filter else ""
 
-    for line in content.splitlines():
-        match = trace_pattern.match(line.strip())
+    for line in lines:
+        line = line.strip()
+        # Une ligne de trace commence toujours par "[" : inutile de lancer la regex sinon
+        if not line.startswith("["):
+            continue
+        match = _TRACE_PATTERN.match(line)
         if not match:
             continue
         entry_date, level, agent, payload = match.groups()
         if since and entry_date < since:
             continue
-        if agent_filter and agent_filter.lower() not in agent.lower():
+        if agent_key and agent_key not in agent.lower():
             continue
         # Focus sur DECISION, CHECKPOINT, FAILURE
         if level in ("DECISION", "CHECKPOINT", "FAILURE", "REMEMBER"):
@@ -231,6 +269,11 @@ def _parse_shared_context_sections(content: str) -> list[str]:
     return sections
 
 
+# Cache des boards parsés (toutes dates), clé (chemin, mtime_ns, taille)
+_BOARD_CACHE: dict[tuple[str, int, int], list[tuple[str, str]]] = {}
+_BOARD_CACHE_MAX = 32
+
+
 def _parse_pheromone_board(project_root: Path,
                           since: str | None = None) -> list[tuple[str, str]]:
     """Parse le pheromone-board.json comme source pour le dream.
@@ -239,34 +282,68 @@ def _parse_pheromone_board(project_root: Path,
     Filtre les phéromones émises par dream-mode pour éviter l'auto-référence,
     sauf celles qui ont été amplifiées (= feedback humain/agent).
     """
-    board_path = project_root / "_bmad-output" / "pheromone-board.json"
-    if not board_path.exists():
+    board_path = _board_path(project_root)
+    try:
+        st = os.stat(board_path)
+    except OSError:
         return []
+
+    # Un board inchangé (même mtime, même taille) n'est pas re-décodé, quel que
+    # soit since : le filtre de date s'applique ensuite sur les entrées en cache.
+    key = (str(board_path), st.st_mtime_ns, st.st_size)
+    cached = _BOARD_CACHE.get(key)
+    if cached is None:
+        cached = _read_pheromone_board(board_path)
+        if len(_BOARD_CACHE) >= _BOARD_CACHE_MAX:
+            del _BOARD_CACHE[next(iter(_BOARD_CACHE))]  # FIFO
+        _BOARD_CACHE[key] = cached
+    if not since:
+        return list(cached)
+    return [e for e in cached if not e[0] or e[0] >= since]
+
+
+def _board_path(project_root: Path) -> Path:
+    """Chemin du pheromone-board.json du projet."""
+    return project_root / "_bmad-output" / "pheromone-board.json"
+
+
+def _forget_board(project_root: Path) -> None:
+    """Invalide le cache du board après une écriture (emit_to_stigmergy)."""
+    path = str(_board_path(project_root))
+    for key in [k for k in _BOARD_CACHE if k[0] == path]:
+        del _BOARD_CACHE[key]
+
+
+def _read_pheromone_board(board_path: Path) -> list[tuple[str, str]]:
+    """Décode le board et garde les phéromones actives, toutes dates (sans cache)."""
+    # json.loads décode directement les bytes (UTF-8 détecté) : pas de str intermédiaire.
+    # ValueError couvre à la fois JSONDecodeError et un UTF-8 invalide.
     try:
-        data = json.loads(board_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        data = json.loads(board_path.read_bytes())
+    except (ValueError, OSError):
+        return []
+    if not isinstance(data, dict):
         return []
 
     entries: list[tuple[str, str]] = []
     for p in data.get("pheromones", []):
+        # Filtres d'abord, sur les seuls champs nécessaires : les entrées écartées
+        # (résolues, auto-émises) ne construisent aucun texte.
         if p.get("resolved", False):
             continue
 
         # Skip dream's own pheromones UNLESS they got reinforced (= feedback signal)
-        if p.get("emitter") == "dream-mode" and p.get("reinforcements", 0) == 0:
+        emitter = p.get("emitter", "?")
+        reinforced = p.get("reinforcements", 0)
+        if emitter == "dream-mode" and reinforced == 0:
             continue
 
-        # Date filter
         ts = p.get("timestamp", "")
         entry_date = ts[:10] if len(ts) >= 10 else ""
-        if since and entry_date and entry_date < since:
-            continue
 
         ptype = p.get("pheromone_type", "NEED")
         location = p.get("location", "?")
         text = p.get("text", "")
-        emitter = p.get("emitter", "?")
-        reinforced = p.get("reinforcements", 0)
 
         label = f"[{ptype}] @{location} by {emitter}"
         if reinforced > 0:
@@ -292,26 +369,31 @@ _STOPWORDS = frozenset({
 })
 
 
-def _extract_keywords(text: str) -> set[str]:
-    """Extrait les mots-clés significatifs d'un texte (unigrams + bigrams)."""
-    words = re.findall(r'[a-zA-ZÀ-ÿ]{3,}', text.lower())
-    significant = [w for w in words if w not in _STOPWORDS]
+_WORD_PATTERN = re.compile(r'[a-zA-ZÀ-ÿ]{3,}')
 
-    # Unigrams
-    result = set(significant)
 
-    # Bigrams — paires de mots significatifs consécutifs dans le texte original
-    # On itère sur les mots bruts pour garder la co-localité
+@functools.lru_cache(maxsize=4096)
+def _extract_keywords(text: str) -> frozenset[str]:
+    """Extrait les mots-clés significatifs d'un texte (unigrams + bigrams).
+
+    Mémoïsé : une même entrée traverse plusieurs passes (connexions,
+    patterns, tensions, dédup). Le résultat est donc immuable.
+    """
+    result: set[str] = set()
+
+    # Une seule passe sur les mots bruts : unigrams significatifs, et bigrams
+    # de mots significatifs consécutifs (un stopword coupe la co-localité)
     prev_sig: str | None = None
-    for w in words:
+    for w in _WORD_PATTERN.findall(text.lower()):
         if w in _STOPWORDS:
             prev_sig = None
             continue
+        result.add(w)
         if prev_sig is not None:
             result.add(f"{prev_sig}_{w}")
         prev_sig = w
 
-    return result
+    return frozenset(result)
 
 
 # Agents connus pour l'attribution automatique
@@ -321,6 +403,7 @@ _KNOWN_AGENTS = frozenset({
 })
 
 _AGENT_PATTERN = re.compile(r'\[([a-z][a-z0-9_-]*)\]', re.IGNORECASE)
+_LEARNINGS_FILE_PATTERN = re.compile(r'learnings/([a-z_-]+)\.md')
 
 
 def _extract_agents(text: str) -> list[str]:
@@ -338,7 +421,9 @@ def _extract_agents(text: str) -> list[str]:
             agents.add(candidate)
 
     # Nom de fichier agent (learnings/dev.md → dev)
-    file_pattern = re.search(r'learnings/([a-z_-]+)\.md', text.lower())
+    text_lower = text.lower()
+    file_pattern = ("learnings/" in text_lower
+                    and _LEARNINGS_FILE_PATTERN.search(text_lower))
     if file_pattern:
         candidate = file_pattern.group(1)
         if candidate in _KNOWN_AGENTS:
@@ -349,8 +434,11 @@ def _extract_agents(text: str) -> list[str]:
 
 def _similarity(text_a: str, text_b: str) -> float:
     """Similarité cosine simplifiée par overlap de keywords."""
-    ka = _extract_keywords(text_a)
-    kb = _extract_keywords(text_b)
+    return _keyword_similarity(_extract_keywords(text_a), _extract_keywords(text_b))
+
+
+def _keyword_similarity(ka: frozenset[str], kb: frozenset[str]) -> float:
+    """Overlap (Jaccard) entre deux ensembles de keywords déjà extraits."""
     if not ka or not kb:
         return 0.0
     intersection = ka & kb
@@ -358,18 +446,74 @@ def _similarity(text_a: str, text_b: str) -> float:
     return len(intersection) / len(union) if union else 0.0
 
 
+def _keyword_masks(keyword_sets: Iterable[frozenset[str]]) -> list[int]:
+    """Encode chaque ensemble de keywords en bitmask int sur un vocabulaire commun.
+
+    Le vocabulaire est local à l'appel : les masks ne sont comparables
+    qu'entre eux (via _mask_similarity).
+    """
+    vocab: dict[str, int] = {}
+    masks: list[int] = []
+    for keywords in keyword_sets:
+        mask = 0
+        for kw in keywords:
+            mask |= 1 << vocab.setdefault(kw, len(vocab))
+        masks.append(mask)
+    return masks
+
+
+def _mask_similarity(mask_a: int, mask_b: int) -> float:
+    """Jaccard entre deux bitmasks produits par un même _keyword_masks()."""
+    if not mask_a or not mask_b:
+        return 0.0
+    return (mask_a & mask_b).bit_count() / (mask_a | mask_b).bit_count()
+
+
+def _keyword_postings(entries: list[str]) -> dict[str, list[int]]:
+    """Index inversé keyword → indices (croissants) des entrées qui le contiennent."""
+    index: dict[str, list[int]] = {}
+    for b, entry in enumerate(entries):
+        for kw in _extract_keywords(entry):
+            index.setdefault(kw, []).append(b)
+    return index
+
+
 def find_cross_connections(sources: list[DreamSource]) -> list[DreamInsight]:
     """Trouve les connexions croisées entre sources différentes."""
     insights: list[DreamInsight] = []
 
+    # Keywords extraits une fois par entrée (bitmasks), pas une fois par paire comparée
+    flat = iter(_keyword_masks(
+        _extract_keywords(e) for src in sources for e in src.entries))
+    keywords = [[next(flat) for _ in src.entries] for src in sources]
+    sizes = [[kw.bit_count() for kw in src_kw] for src_kw in keywords]
+    # Index inversé keyword → entrées, construit à la demande pour les grosses sources
+    postings: dict[int, dict[str, list[int]]] = {}
+
     # Comparer chaque paire de sources de types DIFFÉRENTS
     for i, src_a in enumerate(sources):
         for j, src_b in enumerate(sources):
             if j <= i or src_a.kind == src_b.kind:
                 continue
-            for entry_a in src_a.entries:
-                for entry_b in src_b.entries:
-                    sim = _similarity(entry_a, entry_b)
+            all_b = range(len(src_b.entries))
+            if len(all_b) > INDEX_MIN_ENTRIES and j not in postings:
+                postings[j] = _keyword_postings(src_b.entries)
+            for entry_a, kw_a, n_a in zip(src_a.entries, keywords[i], sizes[i]):
+                if j in postings:
+                    # Seuil > 0 : seules les entrées partageant un keyword peuvent
+                    # matcher ; tri pour garder l'ordre du balayage complet
+                    index = postings[j]
+                    candidates = sorted({b for kw in _extract_keywords(entry_a)
+                                         for b in index.get(kw, ())})
+                else:
+                    candidates = all_b
+                for b in candidates:
+                    entry_b, kw_b, n_b = src_b.entries[b], keywords[j][b], sizes[j][b]
+                    # Sortie anticipée : Jaccard ≤ min/max des tailles, inutile
+                    # de croiser les masks si cette borne reste sous le seuil
+                    if not n_a or not n_b or min(n_a, n_b) / max(n_a, n_b) < SIMILARITY_THRESHOLD:
+                        continue
+                    sim = _mask_similarity(kw_a, kw_b)
                     if sim >= SIMILARITY_THRESHOLD:
                         # Connexion détectée !
                         agents = sorted(set(
@@ -452,23 +596,35 @@ def find_tensions(sources: list[DreamSource]) -> list[DreamInsight]:
                       "risque", "problème", "échec", "fail", "broken", "cassé"],
     }
 
-    positive_entries: list[tuple[str, str]] = []  # (source, entry)
-    negative_entries: list[tuple[str, str]] = []
-
+    marked: list[tuple[str, str, bool, bool]] = []  # (source, entry, positif, négatif)
     for src in sources:
         for entry in src.entries:
             entry_lower = entry.lower()
-            if any(m in entry_lower for m in tension_markers["positive"]):
-                positive_entries.append((src.name, entry))
-            if any(m in entry_lower for m in tension_markers["negative"]):
-                negative_entries.append((src.name, entry))
+            is_pos = any(m in entry_lower for m in tension_markers["positive"])
+            is_neg = any(m in entry_lower for m in tension_markers["negative"])
+            if is_pos or is_neg:
+                marked.append((src.name, entry, is_pos, is_neg))
+
+    masks = _keyword_masks(_extract_keywords(entry) for _, entry, _, _ in marked)
+    positive_entries: list[tuple[str, str, int, int]] = []  # (source, entry, mask, taille)
+    negative_entries: list[tuple[str, str, int, int]] = []
+    for (src_name, entry, is_pos, is_neg), mask in zip(marked, masks):
+        if not mask:
+            continue  # sans keyword, similarité nulle avec toute autre entrée
+        if is_pos:
+            positive_entries.append((src_name, entry, mask, mask.bit_count()))
+        if is_neg:
+            negative_entries.append((src_name, entry, mask, mask.bit_count()))
 
     # Croiser positifs et négatifs sur les mêmes sujets
-    for pos_src, pos_entry in positive_entries:
-        for neg_src, neg_entry in negative_entries:
+    for pos_src, pos_entry, pos_kw, pos_n in positive_entries:
+        for neg_src, neg_entry, neg_kw, neg_n in negative_entries:
             if pos_src == neg_src:
                 continue
-            sim = _similarity(pos_entry, neg_entry)
+            # Jaccard ≤ min/max des tailles : borne sous le seuil → paire ignorée
+            if min(pos_n, neg_n) / max(pos_n, neg_n) < 0.3:
+                continue
+            sim = _mask_similarity(pos_kw, neg_kw)
             if sim >= 0.3:  # Seuil plus bas pour les tensions
                 agents = sorted(set(
                     _extract_agents(pos_entry) +
@@ -553,19 +709,28 @@ def validate_insight(insight: DreamInsight, sources: list[DreamSource]) -> bool:
 
 def deduplicate_insights(insights: list[DreamInsight]) -> list[DreamInsight]:
     """Supprime les insights trop similaires."""
+    masks = _keyword_masks(_extract_keywords(i.description) for i in insights)
     unique: list[DreamInsight] = []
-    for ins in insights:
+    unique_kw: list[tuple[int, int]] = []  # (bitmask, taille) de unique[k], calculés une fois
+    for ins, kw in zip(insights, masks):
+        n = kw.bit_count()
         is_dupe = False
-        for existing in unique:
-            if _similarity(ins.description, existing.description) > 0.7:
+        for k, existing in enumerate(unique):
+            other, other_n = unique_kw[k]
+            # Jaccard ≤ min/max des tailles : si la borne ne dépasse pas 0.7, pas de doublon
+            if not n or not other_n or min(n, other_n) / max(n, other_n) <= 0.7:
+                continue
+            if _mask_similarity(kw, other) > 0.7:
                 # Garder celui avec la meilleure confiance
                 if ins.confidence > existing.confidence:
-                    unique.remove(existing)
+                    del unique[k], unique_kw[k]
                     unique.append(ins)
+                    unique_kw.append((kw, n))
                 is_dupe = True
                 break
         if not is_dupe:
             unique.append(ins)
+            unique_kw.append((kw, n))
     return unique
 
 
@@ -668,8 +833,11 @@ def emit_to_stigmergy(insights: list[DreamInsight],
     board = sg.load_board(project_root)
     emitted = 0
 
-    # Index des textes existants pour déduplication cross-session
-    existing_texts = {p.text for p in board.pheromones if not p.resolved}
+    # Index des textes existants pour déduplication cross-session : une passe
+    # sur le board, puis un lookup O(1) par insight. Seuls les textes "[dream] "
+    # peuvent coïncider avec ceux qu'on émet, inutile d'indexer les autres.
+    existing_texts = {p.text for p in board.pheromones
+                      if not p.resolved and p.text.startswith("[dream] ")}
 
     for ins in insights:
         ptype = _INSIGHT_TO_PHEROMONE.get(ins.category, "NEED")
@@ -695,6 +863,7 @@ def emit_to_stigmergy(insights: list[DreamInsight],
 
     if emitted > 0:
         sg.save_board(project_root, board)
+        _forget_board(project_root)
 
     return emitted
 
@@ -718,26 +887,40 @@ def save_last_dream_timestamp(project_root: Path) -> None:
     ts_dir = project_root / "_bmad" / "_memory"
     ts_dir.mkdir(parents=True, exist_ok=True)
     ts_file = ts_dir / DREAM_TIMESTAMP_FILE
-    ts_file.write_text(datetime.now().strftime("%Y-%m-%d"), encoding="utf-8")
+    # 10 octets bruts écrits à côté puis renommés : un lecteur concurrent voit
+    # l'ancienne date ou la nouvelle, jamais un fichier tronqué
+    tmp_file = ts_dir / f".{DREAM_TIMESTAMP_FILE}.tmp"
+    tmp_file.write_bytes(datetime.now().strftime("%Y-%m-%d").encode("ascii"))
+    os.replace(tmp_file, ts_file)
 
 
 def read_last_dream_timestamp(project_root: Path) -> str | None:
     """Lit le timestamp du dernier dream. Retourne None si aucun."""
     ts_file = project_root / "_bmad" / "_memory" / DREAM_TIMESTAMP_FILE
-    if not ts_file.exists():
-        return None
     try:
-        ts = ts_file.read_text(encoding="utf-8").strip()
-        # Valider le format YYYY-MM-DD
-        if len(ts) == 10 and ts[4] == "-" and ts[7] == "-":
-            return ts
-    except OSError:
-        pass
+        ts = ts_file.read_bytes().strip().decode("ascii")
+    except (OSError, UnicodeDecodeError):
+        return None
+    # Valider le format YYYY-MM-DD
+    if len(ts) == 10 and ts[4] == "-" and ts[7] == "-":
+        return ts
     return None
 
 
 # ── Temporal Decay ────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4096)
+def _parse_day(day: str) -> datetime | None:
+    """'YYYY-MM-DD' → datetime à minuit, None si invalide.
+
+    Mémoïsé : les mêmes dates reviennent d'une source et d'un dream à l'autre.
+    """
+    try:
+        return datetime(int(day[:4]), int(day[5:7]), int(day[8:10]))
+    except ValueError:
+        return None
+
+
 def _temporal_weight(date_str: str, now: datetime | None = None) -> float:
     """Pondération temporelle : récent = 1.0, décroît avec l'âge.
 
@@ -747,10 +930,8 @@ def _temporal_weight(date_str: str, now: datetime | None = None) -> float:
     """
     if not date_str or len(date_str) < 10:
         return 1.0
-    try:
-        entry_date = datetime(int(date_str[:4]), int(date_str[5:7]),
-                              int(date_str[8:10]))
-    except (ValueError, IndexError):
+    entry_date = _parse_day(date_str[:10])
+    if entry_date is None:
         return 1.0
     ref = now or datetime.now()
     age_days = max(0, (ref - entry_date).days)
@@ -770,20 +951,26 @@ def apply_temporal_decay(insights: list[DreamInsight],
     contributrices, puis multiplie la confiance.
     Modifie les insights in-place.
     """
-    # Index source_name → dates
-    source_dates: dict[str, list[str]] = {}
+    # Poids moyen par source, calculé une fois (pas une fois par insight) ;
+    # chaque date distincte n'est pondérée qu'une fois.
+    date_weights: dict[str, float] = {}
+    source_weight: dict[str, float] = {}
     for src in sources:
-        source_dates[src.name] = src.dates
+        src_weights: list[float] = []
+        for d in src.dates:
+            if not d:
+                continue
+            w = date_weights.get(d)
+            if w is None:
+                w = date_weights[d] = _temporal_weight(d, now)
+            src_weights.append(w)
+        if src_weights:
+            source_weight[src.name] = sum(src_weights) / len(src_weights)
+        else:
+            source_weight.pop(src.name, None)
 
     for ins in insights:
-        weights: list[float] = []
-        for src_name in ins.sources:
-            dates = source_dates.get(src_name, [])
-            if dates:
-                # Poids moyen des entrées de cette source
-                src_weights = [_temporal_weight(d, now) for d in dates if d]
-                if src_weights:
-                    weights.append(sum(src_weights) / len(src_weights))
+        weights = [source_weight[n] for n in ins.sources if n in source_weight]
         if weights:
             avg_weight = sum(weights) / len(weights)
             ins.confidence = round(ins.confidence * avg_weight, 3)
@@ -791,13 +978,17 @@ def apply_temporal_decay(insights: list[DreamInsight],
 
 # ── Dream Memory — persistence tracking ──────────────────────────────────────
 
+_NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+
+
 def _insight_signature(insight: DreamInsight) -> str:
     """Signature stable d'un insight pour tracking cross-session.
 
     Combine catégorie + titre normalisé. Les variations mineures de
-    description ne changent pas la signature.
+    description ne changent pas la signature. Le format reste lisible :
+    les signatures sont les clés persistées de dream-memory.json.
     """
-    norm_title = re.sub(r'[^a-z0-9]', '', insight.title.lower())
+    norm_title = _NON_ALNUM_PATTERN.sub('', insight.title.lower())
     return f"{insight.category}:{norm_title}"
 
 
@@ -18,8 +18,9 @@ Fonctions testées :
   - BundleManifest, ExportedLearning, ExportedRule, MigrationBundle dataclasses
 """
 
-import importlib
+import importlib.util
 import json
+import os
 import shutil
 import sys
 import tempfile
@@ -27,57 +28,121 @@ import unittest
 from pathlib import Path
 
 KIT_DIR = Path(__file__).parent.parent
-sys.path.insert(0, str(KIT_DIR / "framework" / "tools"))
 
 
-def _import_cm():
-    return importlib.import_module("cross-migrate")
+# Le fichier porte un tiret : chargé une seule fois ici, puis référencé via `cm`
+_spec = importlib.util.spec_from_file_location(
+    "cross_migrate", KIT_DIR / "framework" / "tools" / "cross-migrate.py")
+cm = importlib.util.module_from_spec(_spec)
+sys.modules["cross_migrate"] = cm
+_spec.loader.exec_module(cm)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+def _write(path: Path, content) -> None:
+    """Écrire un fixture ; accepte str (encodé en UTF-8) ou bytes déjà encodés."""
+    path.write_bytes(content.encode("utf-8") if isinstance(content, str) else content)
+
+
 def _create_project_tree(root: Path, learnings=None, failures=None,
                          dna_proposals=None, forge_proposals=None,
                          consensus=None, antifragile=None,
                          project_context=None):
     """Créer un arbre projet minimal pour les tests."""
     mem = root / "_bmad" / "_memory"
-    mem.mkdir(parents=True, exist_ok=True)
     out = root / "_bmad-output"
-    out.mkdir(parents=True, exist_ok=True)
+    ld = mem / "agent-learnings"
+    dp = out / "dna-proposals"
+    fp = out / "forge-proposals"
+
+    # Ne créer que les feuilles : os.makedirs crée les parents au passage
+    leaves = [ld if learnings else mem]
+    if dna_proposals:
+        leaves.append(dp)
+    if forge_proposals:
+        leaves.append(fp)
+    if not (dna_proposals or forge_proposals):
+        leaves.append(out)
+    for d in leaves:
+        os.makedirs(d, exist_ok=True)
 
     if learnings:
-        ld = mem / "agent-learnings"
-        ld.mkdir(exist_ok=True)
         for name, content in learnings.items():
-            (ld / name).write_text(content, encoding="utf-8")
+            _write(ld / name, content)
 
     if failures:
-        (mem / "failure-museum.md").write_text(failures, encoding="utf-8")
+        _write(mem / "failure-museum.md", failures)
 
     if dna_proposals:
-        dp = out / "dna-proposals"
-        dp.mkdir(exist_ok=True)
         for name, content in dna_proposals.items():
-            (dp / name).write_text(content, encoding="utf-8")
+            _write(dp / name, content)
 
     if forge_proposals:
-        fp = out / "forge-proposals"
-        fp.mkdir(exist_ok=True)
         for name, content in forge_proposals.items():
-            (fp / name).write_text(content, encoding="utf-8")
+            _write(fp / name, content)
 
     if consensus is not None:
-        (out / "consensus-history.json").write_text(
-            json.dumps(consensus), encoding="utf-8")
+        _write(out / "consensus-history.json", json.dumps(consensus))
 
     if antifragile is not None:
-        (out / "antifragile-history.json").write_text(
-            json.dumps(antifragile), encoding="utf-8")
+        _write(out / "antifragile-history.json", json.dumps(antifragile))
 
     if project_context:
-        (root / "project-context.yaml").write_text(
-            project_context, encoding="utf-8")
+        _write(root / "project-context.yaml", project_context)
+
+
+def _rmtree(path):
+    """Supprimer un répertoire de test via os.scandir (pas de lstat par entrée)."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+# Arbre « golden » : construit une fois par module, puis lié (os.link) dans les
+# tmpdirs des tests qui n'ont besoin que de le lire.
+GOLDEN_TREE = {
+    "learnings": {
+        "dev.md": "- [2026-01-01] Test-driven dev\n",
+        "qa.md": "- [2026-01-15] Coverage > 80%\n",
+    },
+    "failures": (
+        "### [2026-01-20] CC-FAIL — Missing guard\n"
+        "- Règle instaurée : Always add guard clauses\n"
+        "- Leçon : Check edge cases\n"
+    ),
+    "consensus": [{"timestamp": "T1", "d": "ok"}],
+    "project_context": 'name: "source-project"\n',
+}
+_golden_dir = None
+
+
+def setUpModule():
+    global _golden_dir
+    _golden_dir = Path(tempfile.mkdtemp())
+    _create_project_tree(_golden_dir, **GOLDEN_TREE)
+
+
+def tearDownModule():
+    _rmtree(_golden_dir)
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _link_golden_tree(dest: Path) -> Path:
+    """Matérialiser l'arbre golden dans dest via hardlinks (lecture seule)."""
+    shutil.copytree(_golden_dir, dest, copy_function=_link_or_copy,
+                    dirs_exist_ok=True)
+    return dest
 
 
 class BaseTest(unittest.TestCase):
@@ -86,108 +151,90 @@ class BaseTest(unittest.TestCase):
         self.root = Path(self.tmpdir)
 
     def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        _rmtree(self.tmpdir)
 
 
 # ── ExportedLearning / ExportedRule dataclass tests ──────────────────────────
 
-class TestExportedLearning(BaseTest):
+class TestExportedLearning(unittest.TestCase):
     def test_to_dict(self):
-        cm = _import_cm()
         learning = cm.ExportedLearning(agent="dev", text="test learning",
                                        date="2026-01-01")
-        d = learning.to_dict()
-        self.assertEqual(d["agent"], "dev")
-        self.assertEqual(d["text"], "test learning")
-        self.assertEqual(d["date"], "2026-01-01")
+        self.assertEqual(learning.to_dict(), {
+            "agent": "dev", "text": "test learning", "date": "2026-01-01"})
 
     def test_from_dict(self):
-        cm = _import_cm()
         d = {"agent": "qa", "text": "qa learning", "date": "2026-02-01"}
-        learning = cm.ExportedLearning.from_dict(d)
-        self.assertEqual(learning.agent, "qa")
-        self.assertEqual(learning.text, "qa learning")
+        self.assertEqual(cm.ExportedLearning.from_dict(d),
+                         cm.ExportedLearning("qa", "qa learning", "2026-02-01"))
 
     def test_from_dict_missing_fields(self):
-        cm = _import_cm()
-        learning = cm.ExportedLearning.from_dict({})
-        self.assertEqual(learning.agent, "")
-        self.assertEqual(learning.text, "")
+        self.assertEqual(cm.ExportedLearning.from_dict({}),
+                         cm.ExportedLearning(agent="", text=""))
 
 
-class TestExportedRule(BaseTest):
+class TestExportedRule(unittest.TestCase):
     def test_to_dict(self):
-        cm = _import_cm()
         r = cm.ExportedRule(category="CC-FAIL", rule="Always verify",
                             lesson="Double check", date="2026-01-15")
-        d = r.to_dict()
-        self.assertEqual(d["category"], "CC-FAIL")
-        self.assertEqual(d["rule"], "Always verify")
+        self.assertEqual(r.to_dict(), {
+            "category": "CC-FAIL", "rule": "Always verify",
+            "lesson": "Double check", "date": "2026-01-15"})
 
     def test_from_dict(self):
-        cm = _import_cm()
         r = cm.ExportedRule.from_dict({"category": "HALLUCINATION",
                                         "rule": "Vérifier les faits"})
-        self.assertEqual(r.category, "HALLUCINATION")
-        self.assertEqual(r.lesson, "")
+        self.assertEqual(r, cm.ExportedRule("HALLUCINATION", "Vérifier les faits"))
 
 
 # ── BundleManifest tests ─────────────────────────────────────────────────────
 
-class TestBundleManifest(BaseTest):
+class TestBundleManifest(unittest.TestCase):
     def test_defaults(self):
-        cm = _import_cm()
         m = cm.BundleManifest()
-        self.assertEqual(m.version, "1.0.0")
-        self.assertEqual(m.magic, "bmad-bundle")
-        self.assertEqual(m.artifact_types, [])
+        self.assertEqual(
+            (m.version, m.magic, m.artifact_types),
+            ("1.0.0", "bmad-bundle", []))
 
     def test_total_items(self):
-        cm = _import_cm()
         m = cm.BundleManifest(total_items=42)
         self.assertEqual(m.total_items, 42)
 
 
 # ── MigrationBundle tests ────────────────────────────────────────────────────
 
-class TestMigrationBundle(BaseTest):
+class TestMigrationBundle(unittest.TestCase):
     def test_to_dict_empty(self):
-        cm = _import_cm()
         b = cm.MigrationBundle(manifest=cm.BundleManifest())
         d = b.to_dict()
         self.assertEqual(d["manifest"]["magic"], "bmad-bundle")
-        self.assertEqual(d["learnings"], [])
-        self.assertEqual(d["rules"], [])
+        self.assertEqual(
+            {k: v for k, v in d.items() if k != "manifest"},
+            {"learnings": [], "rules": [], "dna_patches": [], "agents": [],
+             "consensus": [], "antifragile": []})
 
     def test_roundtrip(self):
-        cm = _import_cm()
         b = cm.MigrationBundle(
             manifest=cm.BundleManifest(source_project="test-proj"),
             learnings=[cm.ExportedLearning("dev", "test", "2026-01-01")],
             rules=[cm.ExportedRule("CC-FAIL", "rule1")],
         )
         d = b.to_dict()
-        b2 = cm.MigrationBundle.from_dict(d)
-        self.assertEqual(b2.manifest.source_project, "test-proj")
-        self.assertEqual(len(b2.learnings), 1)
-        self.assertEqual(len(b2.rules), 1)
+        self.assertEqual(cm.MigrationBundle.from_dict(d), b)
 
 
 # ── export_learnings tests ───────────────────────────────────────────────────
 
 class TestExportLearnings(BaseTest):
     def test_empty_dir(self):
-        cm = _import_cm()
         result = cm.export_learnings(self.root)
         self.assertEqual(result, [])
 
     def test_no_dir(self):
-        cm = _import_cm()
         result = cm.export_learnings(self.root / "nonexistent")
         self.assertEqual(result, [])
 
     def test_basic_learnings(self):
-        cm = _import_cm()
         _create_project_tree(self.root, learnings={
             "dev.md": "# Dev learnings\n- [2026-01-15] Always test first\n- Use type hints\n",
             "qa.md": "# QA learnings\n- [2026-02-01] Coverage matters\n",
@@ -199,7 +246,6 @@ class TestExportLearnings(BaseTest):
         self.assertIn("qa", agents)
 
     def test_learnings_with_since(self):
-        cm = _import_cm()
         _create_project_tree(self.root, learnings={
             "dev.md": "- [2025-12-01] Old learning\n- [2026-03-01] New learning\n",
         })
@@ -208,7 +254,6 @@ class TestExportLearnings(BaseTest):
         self.assertIn("New learning", result[0].text)
 
     def test_learnings_skip_headers(self):
-        cm = _import_cm()
         _create_project_tree(self.root, learnings={
             "dev.md": "# Header\n\n## Section\n- actual learning\n",
         })
@@ -216,7 +261,6 @@ class TestExportLearnings(BaseTest):
         self.assertEqual(len(result), 1)
 
     def test_learnings_empty_file(self):
-        cm = _import_cm()
         _create_project_tree(self.root, learnings={
             "dev.md": "",
         })
@@ -228,12 +272,10 @@ class TestExportLearnings(BaseTest):
 
 class TestExportRules(BaseTest):
     def test_no_failure_museum(self):
-        cm = _import_cm()
         result = cm.export_rules(self.root)
         self.assertEqual(result, [])
 
     def test_basic_rules(self):
-        cm = _import_cm()
         failures = (
             "# Failure Museum\n\n"
             "### [2026-01-10] CC-FAIL — Wrong import\n"
@@ -251,7 +293,6 @@ class TestExportRules(BaseTest):
         self.assertEqual(result[1].category, "HALLUCINATION")
 
     def test_rules_with_since(self):
-        cm = _import_cm()
         failures = (
             "### [2025-06-01] CC-FAIL — Old\n"
             "- Règle instaurée : Old rule\n\n"
@@ -264,7 +305,6 @@ class TestExportRules(BaseTest):
         self.assertEqual(result[0].rule, "New rule")
 
     def test_rules_no_category_match(self):
-        cm = _import_cm()
         failures = (
             "### [2026-01-01] UNKNOWN-TYPE — Something\n"
             "- Règle instaurée : Some rule\n"
@@ -279,12 +319,10 @@ class TestExportRules(BaseTest):
 
 class TestExportDnaPatches(BaseTest):
     def test_no_dir(self):
-        cm = _import_cm()
         result = cm.export_dna_patches(self.root)
         self.assertEqual(result, [])
 
     def test_basic_patches(self):
-        cm = _import_cm()
         _create_project_tree(self.root, dna_proposals={
             "patch-001.yaml": "mutation: add_tool\ntool: linter",
         })
@@ -298,12 +336,10 @@ class TestExportDnaPatches(BaseTest):
 
 class TestExportAgents(BaseTest):
     def test_no_dir(self):
-        cm = _import_cm()
         result = cm.export_agents(self.root)
         self.assertEqual(result, [])
 
     def test_basic_agents(self):
-        cm = _import_cm()
         _create_project_tree(self.root, forge_proposals={
             "linter-agent.proposed.md": "# Linter Agent\nDoes linting.",
         })
@@ -316,18 +352,15 @@ class TestExportAgents(BaseTest):
 
 class TestExportConsensus(BaseTest):
     def test_no_file(self):
-        cm = _import_cm()
         self.assertEqual(cm.export_consensus(self.root), [])
 
     def test_basic(self):
-        cm = _import_cm()
         data = [{"timestamp": "2026-01-01T00:00:00", "decision": "go"}]
         _create_project_tree(self.root, consensus=data)
         result = cm.export_consensus(self.root)
         self.assertEqual(len(result), 1)
 
     def test_invalid_json(self):
-        cm = _import_cm()
         out = self.root / "_bmad-output"
         out.mkdir(parents=True, exist_ok=True)
         (out / "consensus-history.json").write_text("not json")
@@ -336,11 +369,9 @@ class TestExportConsensus(BaseTest):
 
 class TestExportAntifragile(BaseTest):
     def test_no_file(self):
-        cm = _import_cm()
         self.assertEqual(cm.export_antifragile(self.root), [])
 
     def test_basic(self):
-        cm = _import_cm()
         data = [{"timestamp": "2026-01-01", "score": 75}]
         _create_project_tree(self.root, antifragile=data)
         result = cm.export_antifragile(self.root)
@@ -351,30 +382,19 @@ class TestExportAntifragile(BaseTest):
 
 class TestCreateBundle(BaseTest):
     def test_empty_project(self):
-        cm = _import_cm()
         bundle = cm.create_bundle(self.root)
         self.assertEqual(bundle.manifest.total_items, 0)
         self.assertEqual(bundle.manifest.artifact_types, [])
 
     def test_full_bundle(self):
-        cm = _import_cm()
-        _create_project_tree(
-            self.root,
-            learnings={"dev.md": "- Learning 1\n- Learning 2\n"},
-            failures=(
-                "### [2026-01-01] CC-FAIL — test\n"
-                "- Règle instaurée : test rule\n"
-            ),
-            consensus=[{"timestamp": "T1", "d": "ok"}],
-            project_context='name: "test-project"\n',
-        )
+        _link_golden_tree(self.root)
         bundle = cm.create_bundle(self.root)
         self.assertGreater(bundle.manifest.total_items, 0)
-        self.assertEqual(bundle.manifest.source_project, "test-project")
+        self.assertEqual(bundle.manifest.source_project, "source-project")
         self.assertIn("learnings", bundle.manifest.artifact_types)
+        self.assertIn("consensus", bundle.manifest.artifact_types)
 
     def test_only_filter(self):
-        cm = _import_cm()
         _create_project_tree(
             self.root,
             learnings={"dev.md": "- Learning 1\n"},
@@ -388,7 +408,6 @@ class TestCreateBundle(BaseTest):
         self.assertEqual(len(bundle.rules), 0)
 
     def test_since_filter(self):
-        cm = _import_cm()
         _create_project_tree(
             self.root,
             learnings={"dev.md": "- [2025-01-01] Old\n- [2026-06-01] New\n"},
@@ -400,29 +419,37 @@ class TestCreateBundle(BaseTest):
 # ── save_bundle / load_bundle tests ──────────────────────────────────────────
 
 class TestSaveLoadBundle(BaseTest):
-    def test_roundtrip(self):
-        cm = _import_cm()
-        bundle = cm.MigrationBundle(
+    @classmethod
+    def setUpClass(cls):
+        """Un seul aller-retour disque save_bundle → load_bundle par classe."""
+        cls.bundle = cm.MigrationBundle(
             manifest=cm.BundleManifest(source_project="round-trip"),
             learnings=[cm.ExportedLearning("dev", "test", "2026-01-01")],
         )
-        path = self.root / "test-bundle.json"
-        cm.save_bundle(bundle, path)
-        self.assertTrue(path.exists())
+        cls._class_tmpdir = tempfile.mkdtemp()
+        cls.saved_path = cm.save_bundle(
+            cls.bundle, Path(cls._class_tmpdir) / "test-bundle.json")
+        cls.loaded = cm.load_bundle(cls.saved_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        _rmtree(cls._class_tmpdir)
 
-        loaded = cm.load_bundle(path)
-        self.assertEqual(loaded.manifest.source_project, "round-trip")
-        self.assertEqual(len(loaded.learnings), 1)
+    def test_roundtrip_in_memory(self):
+        self.assertEqual(cm.MigrationBundle.from_dict(self.bundle.to_dict()),
+                         self.bundle)
+
+    def test_roundtrip_on_disk(self):
+        self.assertTrue(self.saved_path.exists())
+        self.assertEqual(self.loaded, self.bundle)
 
     def test_load_invalid_magic(self):
-        cm = _import_cm()
         path = self.root / "bad.json"
-        path.write_text(json.dumps({"manifest": {"magic": "wrong"}}))
+        path.write_bytes(b'{"manifest": {"magic": "wrong"}}')
         with self.assertRaises(ValueError):
             cm.load_bundle(path)
 
     def test_save_creates_directories(self):
-        cm = _import_cm()
         bundle = cm.MigrationBundle(manifest=cm.BundleManifest())
         path = self.root / "deep" / "nested" / "bundle.json"
         cm.save_bundle(bundle, path)
@@ -433,7 +460,6 @@ class TestSaveLoadBundle(BaseTest):
 
 class TestImportBundle(BaseTest):
     def test_import_learnings(self):
-        cm = _import_cm()
         bundle = cm.MigrationBundle(
             manifest=cm.BundleManifest(),
             learnings=[
@@ -452,7 +478,6 @@ class TestImportBundle(BaseTest):
         self.assertIn("imported learning", content)
 
     def test_import_learnings_dedup(self):
-        cm = _import_cm()
         # Pre-existing learning
         _create_project_tree(self.root, learnings={
             "dev.md": "- [migré] existing learning\n",
@@ -464,12 +489,11 @@ class TestImportBundle(BaseTest):
                 cm.ExportedLearning("dev", "new learning", ""),
             ],
         )
-        result = cm.import_bundle(bundle, self.root)
+        result = cm.import_bundle(bundle, self.root, dry_run=True)
         self.assertEqual(result.learnings_imported, 1)
         self.assertEqual(result.skipped, 1)
 
     def test_import_rules(self):
-        cm = _import_cm()
         bundle = cm.MigrationBundle(
             manifest=cm.BundleManifest(source_project="src"),
             rules=[cm.ExportedRule("CC-FAIL", "Always test", "", "2026-01-01")],
@@ -480,7 +504,6 @@ class TestImportBundle(BaseTest):
         self.assertTrue(rules_path.exists())
 
     def test_import_rules_dedup(self):
-        cm = _import_cm()
         # Pre-create rules file
         mem = self.root / "_bmad" / "_memory"
         mem.mkdir(parents=True, exist_ok=True)
@@ -491,12 +514,11 @@ class TestImportBundle(BaseTest):
             manifest=cm.BundleManifest(),
             rules=[cm.ExportedRule("CC-FAIL", "Always test", "", "2026-01-01")],
         )
-        result = cm.import_bundle(bundle, self.root)
+        result = cm.import_bundle(bundle, self.root, dry_run=True)
         self.assertEqual(result.rules_imported, 0)
         self.assertEqual(result.skipped, 1)
 
     def test_import_dna_patches(self):
-        cm = _import_cm()
         bundle = cm.MigrationBundle(
             manifest=cm.BundleManifest(),
             dna_patches=[{"filename": "p1.yaml", "content": "mutation: test"}],
@@ -507,7 +529,6 @@ class TestImportBundle(BaseTest):
         self.assertTrue(target.exists())
 
     def test_import_dna_patches_conflict(self):
-        cm = _import_cm()
         # Pre-create the file
         d = self.root / "_bmad-output" / "dna-proposals" / "migrated"
         d.mkdir(parents=True, exist_ok=True)
@@ -517,22 +538,20 @@ class TestImportBundle(BaseTest):
             manifest=cm.BundleManifest(),
             dna_patches=[{"filename": "p1.yaml", "content": "new"}],
         )
-        result = cm.import_bundle(bundle, self.root)
+        result = cm.import_bundle(bundle, self.root, dry_run=True)
         self.assertEqual(result.dna_patches_imported, 0)
         self.assertEqual(result.skipped, 1)
         self.assertGreater(len(result.conflicts), 0)
 
     def test_import_agents(self):
-        cm = _import_cm()
         bundle = cm.MigrationBundle(
             manifest=cm.BundleManifest(),
             agents=[{"filename": "a.proposed.md", "content": "# Agent"}],
         )
-        result = cm.import_bundle(bundle, self.root)
+        result = cm.import_bundle(bundle, self.root, dry_run=True)
         self.assertEqual(result.agents_imported, 1)
 
     def test_import_consensus_merge(self):
-        cm = _import_cm()
         _create_project_tree(self.root, consensus=[
             {"timestamp": "T1", "d": "existing"},
         ])
@@ -543,12 +562,11 @@ class TestImportBundle(BaseTest):
                 {"timestamp": "T2", "d": "new"},
             ],
         )
-        result = cm.import_bundle(bundle, self.root)
+        result = cm.import_bundle(bundle, self.root, dry_run=True)
         self.assertEqual(result.consensus_imported, 1)
         self.assertEqual(result.skipped, 1)
 
     def test_import_antifragile_merge(self):
-        cm = _import_cm()
         _create_project_tree(self.root, antifragile=[
             {"timestamp": "AF1", "score": 50},
         ])
@@ -559,11 +577,10 @@ class TestImportBundle(BaseTest):
                 {"timestamp": "AF2", "score": 75},
             ],
         )
-        result = cm.import_bundle(bundle, self.root)
+        result = cm.import_bundle(bundle, self.root, dry_run=True)
         self.assertEqual(result.antifragile_imported, 1)
 
     def test_import_dry_run(self):
-        cm = _import_cm()
         bundle = cm.MigrationBundle(
             manifest=cm.BundleManifest(),
             learnings=[cm.ExportedLearning("dev", "test", "2026-01-01")],
@@ -577,8 +594,9 @@ class TestImportBundle(BaseTest):
         dev_file = self.root / "_bmad" / "_memory" / "agent-learnings" / "dev.md"
         self.assertFalse(dev_file.exists())
 
+
+class TestImportResult(unittest.TestCase):
     def test_import_result_total(self):
-        cm = _import_cm()
         r = cm.ImportResult(learnings_imported=3, rules_imported=2,
                             dna_patches_imported=1)
         self.assertEqual(r.total, 6)
@@ -588,7 +606,6 @@ class TestImportBundle(BaseTest):
 
 class TestRender(BaseTest):
     def test_render_inspect_empty(self):
-        cm = _import_cm()
         bundle = cm.MigrationBundle(manifest=cm.BundleManifest(
             source_project="test", export_date="2026-01-01T00:00"))
         text = cm.render_inspect(bundle)
@@ -596,7 +613,6 @@ class TestRender(BaseTest):
         self.assertIn("test", text)
 
     def test_render_inspect_with_data(self):
-        cm = _import_cm()
         bundle = cm.MigrationBundle(
             manifest=cm.BundleManifest(
                 source_project="proj",
@@ -613,26 +629,22 @@ class TestRender(BaseTest):
         self.assertIn("dev", text)
 
     def test_render_import_result(self):
-        cm = _import_cm()
         result = cm.ImportResult(learnings_imported=5, skipped=2)
         text = cm.render_import_result(result)
         self.assertIn("5", text)
         self.assertIn("Import terminé", text)
 
     def test_render_import_result_dry_run(self):
-        cm = _import_cm()
         result = cm.ImportResult(learnings_imported=3)
         text = cm.render_import_result(result, dry_run=True)
         self.assertIn("DRY RUN", text)
 
     def test_render_import_result_conflicts(self):
-        cm = _import_cm()
         result = cm.ImportResult(conflicts=["file already exists"])
         text = cm.render_import_result(result)
         self.assertIn("Conflits", text)
 
     def test_render_diff(self):
-        cm = _import_cm()
         _create_project_tree(self.root, learnings={
             "dev.md": "- existing learning\n",
         })
@@ -652,61 +664,43 @@ class TestRender(BaseTest):
 
 class TestGetProjectName(BaseTest):
     def test_from_project_context(self):
-        cm = _import_cm()
         _create_project_tree(self.root,
                              project_context='name: "my-awesome-project"\n')
         name = cm._get_project_name(self.root)
         self.assertEqual(name, "my-awesome-project")
 
     def test_fallback_to_dirname(self):
-        cm = _import_cm()
         name = cm._get_project_name(self.root)
         self.assertEqual(name, self.root.name)
 
 
 # ── _parse_date_from_line tests ──────────────────────────────────────────────
 
-class TestParseDateFromLine(BaseTest):
+class TestParseDateFromLine(unittest.TestCase):
     def test_bracketed_date(self):
-        cm = _import_cm()
         self.assertEqual(cm._parse_date_from_line("[2026-01-15] Something"),
                          "2026-01-15")
 
     def test_unbracketed_date(self):
-        cm = _import_cm()
         self.assertEqual(cm._parse_date_from_line("2026-03-20 text"),
                          "2026-03-20")
 
     def test_no_date(self):
-        cm = _import_cm()
         self.assertEqual(cm._parse_date_from_line("no date here"), "")
 
 
 # ── End-to-end workflow tests ────────────────────────────────────────────────
 
 class TestE2EWorkflow(BaseTest):
+    @classmethod
+    def setUpClass(cls):
+        """Exporter l'arbre golden une seule fois pour toute la classe."""
+        cls.bundle = cm.create_bundle(_golden_dir)
+
     def test_export_import_roundtrip(self):
         """Full export → save → load → import workflow."""
-        cm = _import_cm()
-
-        # Source project
-        src = self.root / "source"
-        _create_project_tree(
-            src,
-            learnings={
-                "dev.md": "- [2026-01-01] Test-driven dev\n",
-                "qa.md": "- [2026-01-15] Coverage > 80%\n",
-            },
-            failures=(
-                "### [2026-01-20] CC-FAIL — Missing guard\n"
-                "- Règle instaurée : Always add guard clauses\n"
-                "- Leçon : Check edge cases\n"
-            ),
-            project_context='name: "source-project"\n',
-        )
-
         # Export
-        bundle = cm.create_bundle(src)
+        bundle = self.bundle
         self.assertGreater(bundle.manifest.total_items, 0)
         self.assertEqual(bundle.manifest.source_project, "source-project")
 
@@ -727,24 +721,17 @@ class TestE2EWorkflow(BaseTest):
 
     def test_double_import_deduplicates(self):
         """Importing the same bundle twice should skip duplicates."""
-        cm = _import_cm()
-
-        bundle = cm.MigrationBundle(
-            manifest=cm.BundleManifest(),
-            learnings=[cm.ExportedLearning("dev", "unique learning", "2026-01-01")],
-        )
-
         target = self.root / "target"
         target.mkdir()
 
         # First import
-        r1 = cm.import_bundle(bundle, target)
-        self.assertEqual(r1.learnings_imported, 1)
+        r1 = cm.import_bundle(self.bundle, target)
+        self.assertEqual(r1.learnings_imported, len(self.bundle.learnings))
 
         # Second import
-        r2 = cm.import_bundle(bundle, target)
-        self.assertEqual(r2.learnings_imported, 0)
-        self.assertEqual(r2.skipped, 1)
+        r2 = cm.import_bundle(self.bundle, target)
+        self.assertEqual(r2.total, 0)
+        self.assertEqual(r2.skipped, r1.total)
 
 
 if __name__ == "__main__":
@@ -13,50 +13,132 @@ Fonctions testées :
   - DNASnapshot, DNAMutation, ObservedTool, ObservedPattern dataclasses
 """
 
+import dataclasses
 import importlib
+import os
+import re
 import shutil
 import sys
 import tempfile
 import unittest
+from collections import defaultdict
 from pathlib import Path
 
-KIT_DIR = Path(__file__).parent.parent
-sys.path.insert(0, str(KIT_DIR / "framework" / "tools"))
+_TOOLS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "framework", "tools")
+if _TOOLS_DIR not in sys.path:
+    sys.path.insert(0, _TOOLS_DIR)
 
+# Importé une seule fois par processus (le nom à tiret impose importlib)
+EVOLVE = importlib.import_module("dna-evolve")
 
-def _import_evolve():
-    return importlib.import_module("dna-evolve")
+# Fixtures en RAM (tmpfs) quand /dev/shm est disponible, sinon tmpdir système
+_SHM_DIR = "/dev/shm"
+FIXTURE_ROOT = _SHM_DIR if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK) else None
 
 
-class TestParseDna(unittest.TestCase):
-    """Test parse_dna() — DNA YAML parsing."""
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+# Chemin fictif des DNASnapshot construits en mémoire
+_FAKE_PATH = Path("test.dna.yaml")
+
+# Pré-encodées en UTF-8 une fois : les tests les écrivent via Path.write_bytes.
+
+_DNA_BASIC_YAML = (
+    "id: infra-ops\n"
+    "version: '2.0.0'\n"
+    "tools_required:\n"
+    "  - name: terraform\n"
+    "    check_command: 'which terraform'\n"
+    "  - name: docker\n"
+    "    check_command: 'which docker'\n"
+    "traits:\n"
+    "  - name: infrastructure-as-code\n"
+    "    rule: 'all infra via code'\n"
+    "constraints:\n"
+    "  - id: no-manual-changes\n"
+    "    enforcement: hard\n"
+    "values:\n"
+    "  - name: automation-first\n"
+).encode("utf-8")
+
+_TOOLS_TRACE = (
+    "## 2026-01-01 | forge | S1\n"
+    "Running terraform plan\n"
+    "Running docker build\n"
+    "Running docker push\n"
+    "terraform apply complete\n"
+).encode("utf-8")
+
+# Assez d'entrées "[CHECKPOINT]" pour déclencher la détection de pattern (≥3)
+_CKPT_TRACE = ("\n".join(
+    f"## 2026-01-{i+1:02d} | dev | S1\n[CHECKPOINT] checkpoint_id: ckpt-00{i}"
+    for i in range(5)
+) + "\n").encode("utf-8")
+
+_SINCE_TRACE = (
+    "## 2025-01-01 | dev | old\n"
+    "Running pytest old tests\n"
+    "\n"
+    "## 2026-06-01 | dev | new\n"
+    "Running pytest new tests\n"
+).encode("utf-8")
+
+_SECURITY_DECISIONS_LOG = (
+    "## 2026-01-01\n"
+    "| Agent | Decision |\n"
+    "| dev | Hardened sécurité on all endpoints |\n"
+    "| ops | Security scan before deploy |\n"
+    "| dev | Added vulnerability checks |\n"
+).encode("utf-8")
+
+
+def _group_by_type(mutations):
+    """Regrouper les mutations par mutation_type en une seule passe."""
+    by_type = defaultdict(list)
+    for m in mutations:
+        by_type[m.mutation_type].append(m)
+    return by_type
+
+
+def _missing(text: str, needles: list[str]) -> list[str]:
+    """Needles absentes de text, cherchées en un seul passage regex."""
+    found = set(re.findall("|".join(map(re.escape, needles)), text))
+    return [n for n in needles if n not in found]
+
+
+_module_tmpdir: Path | None = None
+
+
+def setUpModule():
+    # Un seul tmpdir pour tout le module (équivalent d'une fixture scope="module")
+    global _module_tmpdir
+    _module_tmpdir = Path(tempfile.mkdtemp(dir=FIXTURE_ROOT))
+
 
-    def setUp(self):
-        self.evolve = _import_evolve()
-        self.tmpdir = Path(tempfile.mkdtemp())
+def tearDownModule():
+    shutil.rmtree(_module_tmpdir)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+class SharedTmpdirTest(unittest.TestCase):
+    """Un sous-dossier par classe ; chaque test nomme ses fichiers d'après lui-même."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = _module_tmpdir / cls.__name__
+        cls.tmpdir.mkdir()
+
+    def _path(self, suffix: str) -> Path:
+        return self.tmpdir / f"{self._testMethodName}{suffix}"
+
+
+class TestParseDna(SharedTmpdirTest):
+    """Test parse_dna() — DNA YAML parsing."""
+
+    evolve = EVOLVE
 
     def test_parses_basic_dna(self):
-        f = self.tmpdir / "archetype.dna.yaml"
-        f.write_text(
-            "id: infra-ops\n"
-            "version: '2.0.0'\n"
-            "tools_required:\n"
-            "  - name: terraform\n"
-            "    check_command: 'which terraform'\n"
-            "  - name: docker\n"
-            "    check_command: 'which docker'\n"
-            "traits:\n"
-            "  - name: infrastructure-as-code\n"
-            "    rule: 'all infra via code'\n"
-            "constraints:\n"
-            "  - id: no-manual-changes\n"
-            "    enforcement: hard\n"
-            "values:\n"
-            "  - name: automation-first\n"
-        )
+        f = self._path(".dna.yaml")
+        f.write_bytes(_DNA_BASIC_YAML)
         snap = self.evolve.parse_dna(f)
         self.assertEqual(snap.archetype_id, "infra-ops")
         self.assertEqual(snap.version, "2.0.0")
@@ -66,234 +148,199 @@ class TestParseDna(unittest.TestCase):
         self.assertIn("no-manual-changes", snap.constraints)
         self.assertIn("automation-first", snap.values)
 
-    def test_missing_file(self):
-        snap = self.evolve.parse_dna(self.tmpdir / "nonexistent.dna.yaml")
-        self.assertEqual(snap.archetype_id, "unknown")
-        self.assertEqual(snap.version, "1.0.0")
-        self.assertEqual(len(snap.tools), 0)
-
     def test_empty_dna(self):
-        f = self.tmpdir / "empty.dna.yaml"
-        f.write_text("# Empty DNA\n")
+        f = self._path(".dna.yaml")
+        f.write_bytes(b"# Empty DNA\n")
         snap = self.evolve.parse_dna(f)
         self.assertEqual(snap.archetype_id, "unknown")
 
     def test_preserves_raw_content(self):
-        f = self.tmpdir / "test.dna.yaml"
+        f = self._path(".dna.yaml")
         content = "id: test\nversion: '1.0'\n"
-        f.write_text(content)
+        f.write_bytes(content.encode("utf-8"))
         snap = self.evolve.parse_dna(f)
         self.assertEqual(snap.raw_content, content)
 
 
-class TestAnalyzeTrace(unittest.TestCase):
+class TestAnalyzeTrace(SharedTmpdirTest):
     """Test analyze_trace() — TRACE log analysis."""
 
-    def setUp(self):
-        self.evolve = _import_evolve()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    evolve = EVOLVE
+
+    # Traces maîtres écrites une fois par classe, puis liées (os.link) par test
+    _MASTER_TRACES = {
+        "tools": _TOOLS_TRACE,
+        "checkpoint": _CKPT_TRACE,
+        "since": _SINCE_TRACE,
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._masters = {}
+        for name, data in cls._MASTER_TRACES.items():
+            master = cls.tmpdir / f"master-{name}.md"
+            master.write_bytes(data)
+            cls._masters[name] = master
+
+    def _trace(self, name: str) -> Path:
+        f = self._path("-BMAD_TRACE.md")
+        try:
+            os.link(self._masters[name], f)
+        except OSError:
+            f.write_bytes(self._MASTER_TRACES[name])
+        return f
 
     def test_detects_tools(self):
-        f = self.tmpdir / "BMAD_TRACE.md"
-        f.write_text(
-            "## 2026-01-01 | forge | S1\n"
-            "Running terraform plan\n"
-            "Running docker build\n"
-            "Running docker push\n"
-            "terraform apply complete\n"
-        )
+        f = self._trace("tools")
         tools, patterns = self.evolve.analyze_trace(f)
-        self.assertIn("terraform", tools)
-        self.assertIn("docker", tools)
-        self.assertEqual(tools["terraform"].count, 2)
-        self.assertEqual(tools["docker"].count, 2)
+        counts = {name: tools[name].count for name in ("terraform", "docker") if name in tools}
+        self.assertEqual(counts, {"terraform": 2, "docker": 2})
 
     def test_detects_behavioral_patterns(self):
-        f = self.tmpdir / "BMAD_TRACE.md"
-        # Write enough "[CHECKPOINT]" entries to trigger pattern detection (≥3)
-        lines = []
-        for i in range(5):
-            lines.append(f"## 2026-01-{i+1:02d} | dev | S1\n")
-            lines.append(f"[CHECKPOINT] checkpoint_id: ckpt-00{i}\n")
-        f.write_text("".join(lines))
+        f = self._trace("checkpoint")
         tools, patterns = self.evolve.analyze_trace(f)
         pat_ids = [p.pattern_id for p in patterns]
         self.assertIn("checkpoint-heavy", pat_ids)
 
     def test_empty_trace(self):
-        f = self.tmpdir / "empty.md"
-        f.write_text("")
+        f = self._path("-BMAD_TRACE.md")
+        f.write_bytes(b"")
         tools, patterns = self.evolve.analyze_trace(f)
         self.assertEqual(len(tools), 0)
         self.assertEqual(len(patterns), 0)
 
-    def test_missing_trace(self):
-        tools, patterns = self.evolve.analyze_trace(self.tmpdir / "nope.md")
-        self.assertEqual(len(tools), 0)
-
     def test_since_filter(self):
-        f = self.tmpdir / "trace.md"
-        f.write_text(
-            "## 2025-01-01 | dev | old\n"
-            "Running pytest old tests\n"
-            "\n"
-            "## 2026-06-01 | dev | new\n"
-            "Running pytest new tests\n"
-        )
+        f = self._trace("since")
         tools, _ = self.evolve.analyze_trace(f, since="2026-01-01")
         # pytest should be detected from the filtered content
         if "pytest" in tools:
             self.assertGreater(tools["pytest"].count, 0)
 
 
-class TestAnalyzeDecisionsLog(unittest.TestCase):
+class TestAnalyzeDecisionsLog(SharedTmpdirTest):
     """Test analyze_decisions_log()."""
 
-    def setUp(self):
-        self.evolve = _import_evolve()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    evolve = EVOLVE
 
     def test_detects_security_pattern(self):
-        f = self.tmpdir / "decisions-log.md"
-        f.write_text(
-            "## 2026-01-01\n"
-            "| Agent | Decision |\n"
-            "| dev | Hardened sécurité on all endpoints |\n"
-            "| ops | Security scan before deploy |\n"
-            "| dev | Added vulnerability checks |\n"
-        )
+        f = self._path("-decisions-log.md")
+        f.write_bytes(_SECURITY_DECISIONS_LOG)
         patterns = self.evolve.analyze_decisions_log(f)
         pat_ids = [p.pattern_id for p in patterns]
         self.assertIn("security-first", pat_ids)
 
     def test_no_patterns(self):
-        f = self.tmpdir / "decisions-log.md"
-        f.write_text("## 2026-01-01\n| Agent | Decision |\n| dev | Did something |\n")
+        f = self._path("-decisions-log.md")
+        f.write_bytes(b"## 2026-01-01\n| Agent | Decision |\n| dev | Did something |\n")
         patterns = self.evolve.analyze_decisions_log(f)
         self.assertEqual(len(patterns), 0)
 
-    def test_missing_file(self):
-        patterns = self.evolve.analyze_decisions_log(self.tmpdir / "nope.md")
-        self.assertEqual(len(patterns), 0)
-
 
-class TestAnalyzeLearnings(unittest.TestCase):
+class TestAnalyzeLearnings(SharedTmpdirTest):
     """Test analyze_learnings()."""
 
-    def setUp(self):
-        self.evolve = _import_evolve()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    evolve = EVOLVE
 
     def test_detects_frustration_patterns(self):
-        mem = self.tmpdir / "memory"
+        mem = self._path("-memory")
         mem.mkdir()
-        (mem / "agent-learnings-dev.md").write_text(
-            "# Dev Learnings\n"
-            "- outil manquant: besoin de jq\n"
-            "- tool not found error with yq\n"
-            "- besoin tool manquant helm\n"
+        (mem / "agent-learnings-dev.md").write_bytes(
+            b"# Dev Learnings\n"
+            b"- outil manquant: besoin de jq\n"
+            b"- tool not found error with yq\n"
+            b"- besoin tool manquant helm\n"
         )
         patterns = self.evolve.analyze_learnings(mem)
         pat_ids = [p.pattern_id for p in patterns]
         self.assertIn("missing-tool", pat_ids)
 
     def test_no_patterns(self):
-        mem = self.tmpdir / "memory"
+        mem = self._path("-memory")
         mem.mkdir()
-        (mem / "agent-learnings-dev.md").write_text(
-            "# Dev Learnings\n- Everything works great\n"
+        (mem / "agent-learnings-dev.md").write_bytes(
+            b"# Dev Learnings\n- Everything works great\n"
         )
         patterns = self.evolve.analyze_learnings(mem)
         self.assertEqual(len(patterns), 0)
 
-    def test_missing_dir(self):
-        patterns = self.evolve.analyze_learnings(self.tmpdir / "nope")
-        self.assertEqual(len(patterns), 0)
+
+class TestMissingInputs(SharedTmpdirTest):
+    """Entrées absentes : chaque analyseur retombe sur un résultat vide."""
+
+    evolve = EVOLVE
+
+    def test_missing_inputs(self):
+        missing = self._path("-absent")
+        cases = [
+            (self.evolve.parse_dna,
+             self.evolve.DNASnapshot(source_path=missing, archetype_id="unknown",
+                                     version="1.0.0")),
+            (self.evolve.analyze_trace, ({}, [])),
+            (self.evolve.analyze_decisions_log, []),
+            (self.evolve.analyze_learnings, []),
+        ]
+        for fn, expected in cases:
+            with self.subTest(fn=fn.__name__):
+                self.assertEqual(fn(missing), expected)
 
 
 class TestGenerateMutations(unittest.TestCase):
     """Test generate_mutations()."""
 
-    def setUp(self):
-        self.evolve = _import_evolve()
+    evolve = EVOLVE
 
-    def test_adds_new_tool(self):
-        dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
+    @classmethod
+    def setUpClass(cls):
+        # Gabarit commun ; chaque test n'en varie que les champs utiles
+        cls._base_dna = EVOLVE.DNASnapshot(
+            source_path=_FAKE_PATH,
             archetype_id="test",
             version="1.0",
-            tools=["terraform", "docker"],
         )
+
+    def test_adds_new_tool(self):
+        dna = dataclasses.replace(self._base_dna, tools=["terraform", "docker"])
         observed = {
             "kubectl": self.evolve.ObservedTool(name="kubectl", count=15,
                                                  agents={"forge", "dev"},
                                                  last_seen="2026-06-01"),
         }
-        mutations = self.evolve.generate_mutations(dna, observed, [])
-        add_tools = [m for m in mutations if m.mutation_type == "add_tool"]
+        by_type = _group_by_type(self.evolve.generate_mutations(dna, observed, []))
+        add_tools = by_type["add_tool"]
         self.assertGreater(len(add_tools), 0)
         self.assertEqual(add_tools[0].item_id, "kubectl")
 
     def test_ignores_tool_below_threshold(self):
-        dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
-            archetype_id="test",
-            version="1.0",
-            tools=[],
-        )
+        dna = dataclasses.replace(self._base_dna, tools=[])
         observed = {
             "rare-tool": self.evolve.ObservedTool(name="rare-tool", count=2),
         }
-        mutations = self.evolve.generate_mutations(dna, observed, [])
-        add_tools = [m for m in mutations if m.mutation_type == "add_tool"]
+        by_type = _group_by_type(self.evolve.generate_mutations(dna, observed, []))
+        add_tools = by_type["add_tool"]
         self.assertEqual(len(add_tools), 0)
 
     def test_does_not_readd_existing(self):
-        dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
-            archetype_id="test",
-            version="1.0",
-            tools=["kubectl"],
-        )
+        dna = dataclasses.replace(self._base_dna, tools=["kubectl"])
         observed = {
             "kubectl": self.evolve.ObservedTool(name="kubectl", count=50),
         }
-        mutations = self.evolve.generate_mutations(dna, observed, [])
-        add_tools = [m for m in mutations if m.mutation_type == "add_tool"
-                     and m.item_id == "kubectl"]
+        by_type = _group_by_type(self.evolve.generate_mutations(dna, observed, []))
+        add_tools = [m for m in by_type["add_tool"] if m.item_id == "kubectl"]
         self.assertEqual(len(add_tools), 0)
 
     def test_deprecates_unused_tool(self):
-        dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
-            archetype_id="test",
-            version="1.0",
-            tools=["packer", "terraform"],
-        )
+        dna = dataclasses.replace(self._base_dna, tools=["packer", "terraform"])
         # terraform is used, packer is not
         observed = {
             "terraform": self.evolve.ObservedTool(name="terraform", count=20),
         }
-        mutations = self.evolve.generate_mutations(dna, observed, [])
-        deprecations = [m for m in mutations if m.mutation_type == "deprecate_tool"]
-        deprecated_ids = [m.item_id for m in deprecations]
+        by_type = _group_by_type(self.evolve.generate_mutations(dna, observed, []))
+        deprecated_ids = [m.item_id for m in by_type["deprecate_tool"]]
         self.assertIn("packer", deprecated_ids)
 
     def test_adds_trait_from_pattern(self):
-        dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
-            archetype_id="test",
-            version="1.0",
-        )
+        dna = self._base_dna
         patterns = [
             self.evolve.ObservedPattern(
                 pattern_id="tdd-first",
@@ -303,39 +350,32 @@ class TestGenerateMutations(unittest.TestCase):
                 evidence=["[TDD] write test first"],
             )
         ]
-        mutations = self.evolve.generate_mutations(dna, {}, patterns)
-        trait_adds = [m for m in mutations if "add_trait" in m.mutation_type]
+        by_type = _group_by_type(self.evolve.generate_mutations(dna, {}, patterns))
+        trait_adds = by_type["add_trait"]
         self.assertGreater(len(trait_adds), 0)
         self.assertEqual(trait_adds[0].item_id, "tdd-enforced")
 
     def test_confidence_levels(self):
-        dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
-            archetype_id="test",
-            version="1.0",
-        )
+        dna = self._base_dna
         observed = {
             "high-freq": self.evolve.ObservedTool(name="high-freq", count=20),
             "med-freq": self.evolve.ObservedTool(name="med-freq", count=8),
             "low-freq": self.evolve.ObservedTool(name="low-freq", count=5),
         }
-        mutations = self.evolve.generate_mutations(dna, observed, [])
-        confidences = {m.item_id: m.confidence for m in mutations
-                       if m.mutation_type == "add_tool"}
-        self.assertEqual(confidences.get("high-freq"), "high")
-        self.assertEqual(confidences.get("med-freq"), "medium")
-        self.assertEqual(confidences.get("low-freq"), "low")
+        by_type = _group_by_type(self.evolve.generate_mutations(dna, observed, []))
+        confidences = {m.item_id: m.confidence for m in by_type["add_tool"]}
+        self.assertEqual(confidences, {
+            "high-freq": "high", "med-freq": "medium", "low-freq": "low"})
 
 
 class TestRenderPatchYaml(unittest.TestCase):
     """Test render_patch_yaml()."""
 
-    def setUp(self):
-        self.evolve = _import_evolve()
+    evolve = EVOLVE
 
     def test_renders_patch(self):
         dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
+            source_path=_FAKE_PATH,
             archetype_id="infra-ops",
             version="2.0.0",
         )
@@ -351,13 +391,11 @@ class TestRenderPatchYaml(unittest.TestCase):
             ),
         ]
         output = self.evolve.render_patch_yaml(dna, mutations)
-        self.assertIn("kubectl", output)
-        self.assertIn("tools_required_ADD", output)
-        self.assertIn("HIGH", output)
+        self.assertEqual(_missing(output, ["kubectl", "tools_required_ADD", "HIGH"]), [])
 
     def test_renders_deprecation(self):
         dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
+            source_path=_FAKE_PATH,
             archetype_id="test",
             version="1.0",
         )
@@ -373,19 +411,17 @@ class TestRenderPatchYaml(unittest.TestCase):
             ),
         ]
         output = self.evolve.render_patch_yaml(dna, mutations)
-        self.assertIn("packer", output)
-        self.assertIn("DEPRECATE", output)
+        self.assertEqual(_missing(output, ["packer", "DEPRECATE"]), [])
 
 
 class TestRenderReportMd(unittest.TestCase):
     """Test render_report_md()."""
 
-    def setUp(self):
-        self.evolve = _import_evolve()
+    evolve = EVOLVE
 
     def test_renders_report(self):
         dna = self.evolve.DNASnapshot(
-            source_path=Path("test.dna.yaml"),
+            source_path=_FAKE_PATH,
             archetype_id="infra-ops",
             version="2.0.0",
             tools=["terraform"],
@@ -412,26 +448,36 @@ class TestRenderReportMd(unittest.TestCase):
                                          description="TDD", occurrences=5),
         ]
         report = self.evolve.render_report_md(dna, mutations, observed_tools, patterns)
-        self.assertIn("DNA Evolution Report", report)
-        self.assertIn("infra-ops", report)
-        self.assertIn("kubectl", report)
-        self.assertIn("terraform", report)
-        self.assertIn("tdd-first", report)
+        self.assertEqual(_missing(report, [
+            "DNA Evolution Report", "infra-ops", "kubectl", "terraform", "tdd-first",
+        ]), [])
 
 
 class TestKnownToolPatterns(unittest.TestCase):
     """Verify KNOWN_TOOLS_PATTERNS are valid regex."""
 
-    def setUp(self):
-        self.evolve = _import_evolve()
+    evolve = EVOLVE
 
     def test_all_patterns_compile(self):
-        import re
-        for tool_name, pattern in self.evolve.KNOWN_TOOLS_PATTERNS.items():
-            try:
-                re.compile(pattern)
-            except re.error as e:
-                self.fail(f"Invalid regex for tool {tool_name}: {e}")
+        patterns = self.evolve.KNOWN_TOOLS_PATTERNS
+        # Une seule compilation pour l'alternance de tous les patterns ;
+        # on ne repasse pattern par pattern que pour nommer le fautif.
+        try:
+            re.compile("|".join(f"(?:{p})" for p in patterns.values()))
+        except re.error:
+            for tool_name, pattern in patterns.items():
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    self.fail(f"Invalid regex for tool {tool_name}: {e}")
+            raise
+
+    def test_patterns_precompiled(self):
+        """analyze_trace réutilise des regex compilées à l'import du module."""
+        compiled = self.evolve._COMPILED_TOOL_PATTERNS
+        self.assertEqual(compiled.keys(), self.evolve.KNOWN_TOOLS_PATTERNS.keys())
+        for tool_name, pattern in compiled.items():
+            self.assertEqual(pattern.pattern, self.evolve.KNOWN_TOOLS_PATTERNS[tool_name])
 
 
 if __name__ == "__main__":
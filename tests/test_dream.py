@@ -4,8 +4,8 @@ Tests pour dream.py — BMAD Dream Mode.
 
 Fonctions testées :
   - collect_sources()
-  - _parse_markdown_entries()
-  - _parse_trace_entries()
+  - _parse_markdown_entries() / _parse_markdown_lines()
+  - _parse_trace_entries() / _parse_trace_lines()
   - _parse_shared_context_sections()
   - _extract_keywords()
   - _similarity()
@@ -22,59 +22,96 @@ Fonctions testées :
 """
 
 import importlib
-import shutil
+import json
+import os
+import re
 import sys
 import tempfile
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 KIT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(KIT_DIR / "framework" / "tools"))
 
 
-def _import_dream():
-    return importlib.import_module("dream")
+# Importé une seule fois par processus, partagé par toutes les classes
+DREAM = importlib.import_module("dream")
 
+# Fixtures en RAM (tmpfs) quand /dev/shm est disponible, sinon tmpdir système
+_SHM_DIR = "/dev/shm"
+FIXTURE_ROOT = _SHM_DIR if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK) else None
 
-# ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _create_memory_tree(root: Path, learnings=None, decisions=None,
-                        trace=None, failures=None, shared=None,
-                        contradictions=None):
-    """Créer un arbre mémoire minimal pour les tests."""
-    mem = root / "_bmad" / "_memory"
-    mem.mkdir(parents=True, exist_ok=True)
+# ── Fixtures partagées ────────────────────────────────────────────────────────
 
-    if learnings:
-        ld = mem / "agent-learnings"
-        ld.mkdir(exist_ok=True)
-        for name, content in learnings.items():
-            (ld / name).write_text(content, encoding="utf-8")
+# Pré-encodées en UTF-8 une fois : _create_memory_tree les écrit via write_bytes.
 
-    if decisions:
-        (mem / "decisions-log.md").write_text(decisions, encoding="utf-8")
+# Learnings dev autour du caching (dream, dream_quick, dream(quick=True))
+_FIXTURE_DEV_CACHING = (
+    b"- [2025-06-01] TODO: refactor caching layer\n"
+    b"- [2025-06-02] caching improved performance database\n"
+    b"- [2025-06-03] caching invalidation still problematic\n"
+)
 
-    if failures:
-        (mem / "failure-museum.md").write_text(failures, encoding="utf-8")
+_FIXTURE_CACHING_DECISION = b"- [2025-06-01] Implemented caching strategy database layer\n"
 
-    if shared:
-        (mem / "shared-context.md").write_text(shared, encoding="utf-8")
+# Entrées qui se recoupent, juste au-delà du plafond : les passes O(n²) de dream()
+# n'ont pas besoin de plus pour que le plafonnement soit vérifié
+_FIXTURE_TODO_ITEMS = "\n".join(
+    f"- [2025-06-{i:02d}] TODO: refactor item {i} needs improvement"
+    for i in range(1, DREAM.MAX_INSIGHTS + 2)
+).encode("utf-8")
+_FIXTURE_DECIDED_ITEMS = _FIXTURE_TODO_ITEMS.replace(b"TODO:", b"Decided:")
 
-    if contradictions:
-        (mem / "contradiction-log.md").write_text(contradictions, encoding="utf-8")
 
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def _create_memory_tree(root: Path, learnings=None, decisions=None,
+                        trace=None, failures=None, shared=None,
+                        contradictions=None):
+    """Créer un arbre mémoire minimal pour les tests (contenus str ou bytes)."""
+    mem = root / "_bmad" / "_memory"
+    ld = mem / "agent-learnings"
+    out = root / "_bmad-output"
+
+    # Ne créer que les feuilles : os.makedirs crée les parents au passage
+    os.makedirs(ld if learnings else mem, exist_ok=True)
     if trace:
-        out = root / "_bmad-output"
-        out.mkdir(parents=True, exist_ok=True)
-        (out / "BMAD_TRACE.md").write_text(trace, encoding="utf-8")
+        os.makedirs(out, exist_ok=True)
+
+    # Tous les fichiers en une passe, sans mkdir intercalé
+    files = [(ld / name, content) for name, content in (learnings or {}).items()]
+    files += [(path, content) for path, content in (
+        (mem / "decisions-log.md", decisions),
+        (mem / "failure-museum.md", failures),
+        (mem / "shared-context.md", shared),
+        (mem / "contradiction-log.md", contradictions),
+        (out / "BMAD_TRACE.md", trace),
+    ) if content]
+    for path, content in files:
+        path.write_bytes(content if isinstance(content, bytes) else content.encode("utf-8"))
+
+
+class TmpDirTest(unittest.TestCase):
+    """Un tmpdir par classe ; chaque test travaille dans son propre sous-dossier."""
+
+    @classmethod
+    def setUpClass(cls):
+        tmp = tempfile.TemporaryDirectory(prefix="bmad-", dir=FIXTURE_ROOT)
+        cls.addClassCleanup(tmp.cleanup)
+        cls._root = Path(tmp.name)
+
+    def setUp(self):
+        self.tmpdir = self._root / self._testMethodName
+        self.tmpdir.mkdir()
 
 
 # ── Test DreamSource / DreamInsight ───────────────────────────────────────────
 
 class TestDataClasses(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_dream_source_defaults(self):
         src = self.mod.DreamSource(name="test.md", kind="learnings")
@@ -92,54 +129,40 @@ class TestDataClasses(unittest.TestCase):
 
 # ── Test _parse_markdown_entries ──────────────────────────────────────────────
 
-class TestParseMarkdownEntries(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-
-    def test_parses_dated_entries(self):
-        f = self.tmpdir / "test.md"
-        f.write_text(
-            "# Learnings\n"
-            "- [2025-01-15] Important learning about caching\n"
-            "- [2025-01-20] Another learning about API design\n",
-            encoding="utf-8",
-        )
-        entries = self.mod._parse_markdown_entries(f)
-        self.assertEqual(len(entries), 2)
-        self.assertEqual(entries[0][0], "2025-01-15")
-        self.assertIn("caching", entries[0][1])
-
-    def test_filters_by_since(self):
+class TestParseMarkdownEntries(TmpDirTest):
+    mod = DREAM
+
+    # (nom, lignes, since, nb attendu, (date, fragment) attendus sur la 1re entrée)
+    _VARIANTS = [
+        ("dated", [
+            "# Learnings",
+            "- [2025-01-15] Important learning about caching",
+            "- [2025-01-20] Another learning about API design",
+        ], None, 2, ("2025-01-15", "caching")),
+        ("since", [
+            "- [2025-01-01] Old entry",
+            "- [2025-06-01] New entry",
+        ], "2025-03-01", 1, ("2025-06-01", "New")),
+        ("undated", [
+            "- entry without date",
+            "* another entry",
+        ], None, 2, ("", "without date")),
+        ("headers_and_blanks", ["# Header", "", "## Sub", "", "- Actual entry"], None, 1, ("", "Actual")),
+    ]
+
+    def test_parse_variants(self):
+        for name, lines, since, expected_count, (expected_date, fragment) in self._VARIANTS:
+            with self.subTest(name=name):
+                entries = self.mod._parse_markdown_lines(lines, since=since)
+                self.assertEqual(len(entries), expected_count)
+                self.assertEqual(entries[0][0], expected_date)
+                self.assertIn(fragment, entries[0][1])
+
+    def test_reads_file(self):
         f = self.tmpdir / "test.md"
-        f.write_text(
-            "- [2025-01-01] Old entry\n"
-            "- [2025-06-01] New entry\n",
-            encoding="utf-8",
-        )
-        entries = self.mod._parse_markdown_entries(f, since="2025-03-01")
-        self.assertEqual(len(entries), 1)
-        self.assertIn("New", entries[0][1])
-
-    def test_handles_undated_entries(self):
-        f = self.tmpdir / "test.md"
-        f.write_text(
-            "- entry without date\n"
-            "* another entry\n",
-            encoding="utf-8",
-        )
+        f.write_bytes(b"# Learnings\n- [2025-01-15] Important learning about caching\n")
         entries = self.mod._parse_markdown_entries(f)
-        self.assertEqual(len(entries), 2)
-        self.assertEqual(entries[0][0], "")  # no date
-
-    def test_skips_headers_and_blanks(self):
-        f = self.tmpdir / "test.md"
-        f.write_text("# Header\n\n## Sub\n\n- Actual entry\n", encoding="utf-8")
-        entries = self.mod._parse_markdown_entries(f)
-        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries, [("2025-01-15", "[2025-01-15] Important learning about caching")])
 
     def test_missing_file(self):
         entries = self.mod._parse_markdown_entries(self.tmpdir / "nope.md")
@@ -147,66 +170,63 @@ class TestParseMarkdownEntries(unittest.TestCase):
 
     def test_empty_file(self):
         f = self.tmpdir / "empty.md"
-        f.write_text("", encoding="utf-8")
+        f.write_bytes(b"")
         entries = self.mod._parse_markdown_entries(f)
         self.assertEqual(entries, [])
 
 
 # ── Test _parse_trace_entries ─────────────────────────────────────────────────
 
-class TestParseTraceEntries(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+class TestParseTraceEntries(TmpDirTest):
+    mod = DREAM
 
     def test_parses_standard_trace(self):
-        f = self.tmpdir / "BMAD_TRACE.md"
-        f.write_text(
-            "[2025-06-01 10:00] [DECISION] [architect] Chose microservices arch\n"
-            "[2025-06-01 10:05] [INFO] [dev] Starting implementation\n"
-            "[2025-06-01 10:10] [CHECKPOINT] [pm] Sprint review done\n"
-            "[2025-06-01 10:15] [FAILURE] [qa] Test suite broken\n",
-            encoding="utf-8",
-        )
-        entries = self.mod._parse_trace_entries(f)
+        entries = self.mod._parse_trace_lines([
+            "[2025-06-01 10:00] [DECISION] [architect] Chose microservices arch",
+            "[2025-06-01 10:05] [INFO] [dev] Starting implementation",
+            "[2025-06-01 10:10] [CHECKPOINT] [pm] Sprint review done",
+            "[2025-06-01 10:15] [FAILURE] [qa] Test suite broken",
+        ])
         # INFO is not included (only DECISION, CHECKPOINT, FAILURE, REMEMBER)
         self.assertEqual(len(entries), 3)
 
     def test_filters_by_agent(self):
-        f = self.tmpdir / "trace.md"
-        f.write_text(
-            "[2025-06-01 10:00] [DECISION] [dev] Choice A\n"
-            "[2025-06-01 10:05] [DECISION] [architect] Choice B\n",
-            encoding="utf-8",
-        )
-        entries = self.mod._parse_trace_entries(f, agent_filter="dev")
+        entries = self.mod._parse_trace_lines([
+            "[2025-06-01 10:00] [DECISION] [dev] Choice A",
+            "[2025-06-01 10:05] [DECISION] [architect] Choice B",
+        ], agent_filter="dev")
         self.assertEqual(len(entries), 1)
         self.assertIn("dev", entries[0][1])
 
     def test_filters_by_since(self):
-        f = self.tmpdir / "trace.md"
-        f.write_text(
-            "[2025-01-01 10:00] [DECISION] [dev] Old\n"
-            "[2025-07-01 10:00] [DECISION] [dev] New\n",
-            encoding="utf-8",
-        )
-        entries = self.mod._parse_trace_entries(f, since="2025-06-01")
+        entries = self.mod._parse_trace_lines([
+            "[2025-01-01 10:00] [DECISION] [dev] Old",
+            "[2025-07-01 10:00] [DECISION] [dev] New",
+        ], since="2025-06-01")
         self.assertEqual(len(entries), 1)
         self.assertIn("New", entries[0][1])
 
+    def test_reads_file(self):
+        f = self.tmpdir / "BMAD_TRACE.md"
+        f.write_bytes(b"[2025-06-01 10:00] [DECISION] [dev] Choice A\n")
+        entries = self.mod._parse_trace_entries(f)
+        self.assertEqual(entries, [("2025-06-01", "[dev] [DECISION] Choice A")])
+
     def test_missing_file(self):
         entries = self.mod._parse_trace_entries(self.tmpdir / "nope.md")
         self.assertEqual(entries, [])
 
+    def test_empty_file(self):
+        f = self.tmpdir / "BMAD_TRACE.md"
+        f.write_bytes(b"")
+        entries = self.mod._parse_trace_entries(f)
+        self.assertEqual(entries, [])
+
 
 # ── Test _parse_shared_context_sections ───────────────────────────────────────
 
 class TestParseSharedContext(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_extracts_sections(self):
         content = (
@@ -231,8 +251,7 @@ class TestParseSharedContext(unittest.TestCase):
 # ── Test _extract_keywords ────────────────────────────────────────────────────
 
 class TestExtractKeywords(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_removes_stopwords(self):
         kw = self.mod._extract_keywords("the api is in the database server")
@@ -257,12 +276,16 @@ class TestExtractKeywords(unittest.TestCase):
         kw = self.mod._extract_keywords("")
         self.assertEqual(kw, set())
 
+    def test_memoized_and_immutable(self):
+        kw = self.mod._extract_keywords("database caching layer")
+        self.assertIsInstance(kw, frozenset)
+        self.assertIs(self.mod._extract_keywords("database caching layer"), kw)
+
 
 # ── Test _similarity ──────────────────────────────────────────────────────────
 
 class TestSimilarity(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_identical_texts(self):
         sim = self.mod._similarity("database caching layer", "database caching layer")
@@ -284,16 +307,25 @@ class TestSimilarity(unittest.TestCase):
         sim = self.mod._similarity("", "something")
         self.assertEqual(sim, 0.0)
 
+    def test_keyword_similarity_matches_text_similarity(self):
+        a, b = "database caching performance", "database indexing performance"
+        sim = self.mod._keyword_similarity(self.mod._extract_keywords(a), self.mod._extract_keywords(b))
+        self.assertEqual(sim, self.mod._similarity(a, b))
 
-# ── Test collect_sources ──────────────────────────────────────────────────────
+    def test_mask_similarity_matches_keyword_similarity(self):
+        texts = ["database caching performance", "database indexing performance", "banana orange fruit", ""]
+        kws = [self.mod._extract_keywords(t) for t in texts]
+        masks = self.mod._keyword_masks(kws)
+        for i, j in [(0, 0), (0, 1), (0, 2), (1, 3)]:
+            with self.subTest(pair=(i, j)):
+                self.assertEqual(self.mod._mask_similarity(masks[i], masks[j]),
+                                 self.mod._keyword_similarity(kws[i], kws[j]))
 
-class TestCollectSources(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+# ── Test collect_sources ──────────────────────────────────────────────────────
+
+class TestCollectSources(TmpDirTest):
+    mod = DREAM
 
     def test_collects_learnings(self):
         _create_memory_tree(self.tmpdir, learnings={
@@ -304,6 +336,17 @@ class TestCollectSources(unittest.TestCase):
         self.assertEqual(sources[0].kind, "learnings")
         self.assertEqual(len(sources[0].entries), 1)
 
+    def test_many_learnings_keep_file_order(self):
+        """Au-delà du seuil de lecture parallèle, l'ordre trié est conservé."""
+        names = [f"agent{i:02d}.md" for i in range(self.mod.PARALLEL_PARSE_MIN_FILES + 2)]
+        _create_memory_tree(self.tmpdir, learnings={
+            name: f"- [2025-06-01] entry from {name}\n" for name in reversed(names)
+        } | {"empty.md": "# Rien\n"})
+        sources = self.mod.collect_sources(self.tmpdir, since="2025-01-01")
+        self.assertEqual([s.name for s in sources],
+                         [f"learnings/{name}" for name in names])
+        self.assertEqual(sources[0].dates, ["2025-06-01"])
+
     def test_collects_decisions(self):
         _create_memory_tree(self.tmpdir, decisions=(
             "# Decisions\n- [2025-06-01] Chose PostgreSQL for persistence\n"
@@ -382,8 +425,7 @@ class TestCollectSources(unittest.TestCase):
 # ── Test find_cross_connections ───────────────────────────────────────────────
 
 class TestFindCrossConnections(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_finds_connection_between_different_kinds(self):
         src_a = self.mod.DreamSource(
@@ -426,12 +468,31 @@ class TestFindCrossConnections(unittest.TestCase):
         insights = self.mod.find_cross_connections([])
         self.assertEqual(insights, [])
 
+    def test_indexed_scan_matches_full_scan(self):
+        """Au-delà de INDEX_MIN_ENTRIES, l'index inversé donne les mêmes connexions."""
+        topics = ["database caching layer", "queue retry timeout",
+                  "auth token session", "deploy build pipeline"]
+        n = self.mod.INDEX_MIN_ENTRIES + 8
+        src_a = self.mod.DreamSource(
+            name="learnings/dev.md", kind="learnings",
+            entries=[topics[k % 4] for k in range(n)],
+        )
+        src_b = self.mod.DreamSource(
+            name="decisions-log.md", kind="decisions",
+            entries=[f"{topics[k % 4]} review" if k % 5 == 0 else f"unrelated{k} item"
+                     for k in range(n)],
+        )
+        indexed = self.mod.find_cross_connections([src_a, src_b])
+        with patch.object(self.mod, "INDEX_MIN_ENTRIES", n):
+            full = self.mod.find_cross_connections([src_a, src_b])
+        self.assertGreater(len(indexed), 0)
+        self.assertEqual(indexed, full)
+
 
 # ── Test find_recurring_patterns ──────────────────────────────────────────────
 
 class TestFindRecurringPatterns(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_detects_recurring_keyword(self):
         src_a = self.mod.DreamSource(
@@ -467,8 +528,7 @@ class TestFindRecurringPatterns(unittest.TestCase):
 # ── Test find_tensions ────────────────────────────────────────────────────────
 
 class TestFindTensions(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_detects_tension(self):
         src_a = self.mod.DreamSource(
@@ -512,8 +572,7 @@ class TestFindTensions(unittest.TestCase):
 # ── Test find_opportunities ───────────────────────────────────────────────────
 
 class TestFindOpportunities(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_finds_todo(self):
         src = self.mod.DreamSource(
@@ -564,8 +623,9 @@ class TestFindOpportunities(unittest.TestCase):
 # ── Test validate_insight ─────────────────────────────────────────────────────
 
 class TestValidateInsight(unittest.TestCase):
+    mod = DREAM
+
     def setUp(self):
-        self.mod = _import_dream()
         self.sources = [
             self.mod.DreamSource(name="a.md", kind="learnings"),
             self.mod.DreamSource(name="b.md", kind="decisions"),
@@ -617,8 +677,7 @@ class TestValidateInsight(unittest.TestCase):
 # ── Test deduplicate_insights ─────────────────────────────────────────────────
 
 class TestDeduplicateInsights(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_removes_duplicates(self):
         ins_a = self.mod.DreamInsight(
@@ -655,36 +714,33 @@ class TestDeduplicateInsights(unittest.TestCase):
 
 # ── Test dream() orchestrator ─────────────────────────────────────────────────
 
-class TestDream(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+class TestDream(TmpDirTest):
+    mod = DREAM
 
-    def test_returns_empty_no_sources(self):
-        result = self.mod.dream(self.tmpdir)
-        self.assertEqual(result, [])
-
-    def test_returns_insights_from_rich_data(self):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Arbre riche canonique, construit une fois : dream() ne fait que le lire
+        cls._rich_root = cls._root / "_rich"
         _create_memory_tree(
-            self.tmpdir,
+            cls._rich_root,
             learnings={
-                "dev.md": (
-                    "- [2025-06-01] TODO: refactor caching layer\n"
-                    "- [2025-06-02] caching improved performance database\n"
-                    "- [2025-06-03] caching invalidation still problematic\n"
-                ),
+                "dev.md": _FIXTURE_DEV_CACHING,
             },
             decisions=(
-                "- [2025-06-01] Implemented caching strategy database sessions layer\n"
+                b"- [2025-06-01] Implemented caching strategy database sessions layer\n"
             ),
             failures=(
-                "- [2025-06-01] caching caused stale data problem in database\n"
+                b"- [2025-06-01] caching caused stale data problem in database\n"
             ),
         )
-        insights = self.mod.dream(self.tmpdir)
+
+    def test_returns_empty_no_sources(self):
+        result = self.mod.dream(self.tmpdir)
+        self.assertEqual(result, [])
+
+    def test_returns_insights_from_rich_data(self):
+        insights = self.mod.dream(self._rich_root)
         self.assertGreater(len(insights), 0)
         # Should be sorted by confidence desc
         if len(insights) >= 2:
@@ -692,14 +748,10 @@ class TestDream(unittest.TestCase):
 
     def test_respects_max_insights(self):
         # Create many overlapping entries to generate lots of insights
-        entries = "\n".join(
-            f"- [2025-06-{i:02d}] TODO: refactor item {i} needs improvement"
-            for i in range(1, 25)
-        )
         _create_memory_tree(
             self.tmpdir,
-            learnings={"dev.md": entries},
-            decisions=entries.replace("TODO:", "Decided:"),
+            learnings={"dev.md": _FIXTURE_TODO_ITEMS},
+            decisions=_FIXTURE_DECIDED_ITEMS,
         )
         insights = self.mod.dream(self.tmpdir)
         self.assertLessEqual(len(insights), self.mod.MAX_INSIGHTS)
@@ -734,12 +786,8 @@ class TestDream(unittest.TestCase):
 # ── Test render_journal ───────────────────────────────────────────────────────
 
 class TestRenderJournal(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    mod = DREAM
+    root = Path("absent-project")  # render_journal ne touche pas au disque
 
     def test_renders_markdown(self):
         sources = [
@@ -751,7 +799,7 @@ class TestRenderJournal(unittest.TestCase):
                 sources=["a.md"], category="pattern", confidence=0.8,
             ),
         ]
-        md = self.mod.render_journal(insights, sources, self.tmpdir)
+        md = self.mod.render_journal(insights, sources, self.root)
         self.assertIn("Dream Journal", md)
         self.assertIn("Test Insight", md)
         self.assertIn("pattern", md)
@@ -765,32 +813,27 @@ class TestRenderJournal(unittest.TestCase):
                 category="pattern", confidence=0.7,
             ),
         ]
-        md = self.mod.render_journal(insights, sources, self.tmpdir)
+        md = self.mod.render_journal(insights, sources, self.root)
         self.assertIn("Résumé", md)
         self.assertIn("Catégorie", md)
 
     def test_includes_since_info(self):
         sources = [self.mod.DreamSource(name="a.md", kind="learnings", entries=["e"])]
         insights = []
-        md = self.mod.render_journal(insights, sources, self.tmpdir, since="2025-01-01")
+        md = self.mod.render_journal(insights, sources, self.root, since="2025-01-01")
         self.assertIn("2025-01-01", md)
 
 
 # ── Test write_journal ────────────────────────────────────────────────────────
 
-class TestWriteJournal(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+class TestWriteJournal(TmpDirTest):
+    mod = DREAM
 
     def test_writes_file(self):
         content = "# Test Journal\nHello"
         path = self.mod.write_journal(content, self.tmpdir)
         self.assertTrue(path.exists())
-        self.assertEqual(path.read_text(encoding="utf-8"), content)
+        self.assertEqual(path.read_bytes(), content.encode())
 
     def test_creates_output_dir(self):
         deep = self.tmpdir / "sub" / "project"
@@ -805,11 +848,11 @@ class TestWriteJournal(unittest.TestCase):
         # Write second — should archive first
         self.mod.write_journal("Second", self.tmpdir)
         journal_path = self.tmpdir / "_bmad-output" / "dream-journal.md"
-        self.assertEqual(journal_path.read_text(encoding="utf-8"), "Second")
+        self.assertEqual(journal_path.read_bytes(), b"Second")
         archives = list((self.tmpdir / "_bmad-output" / "dream-archives").glob("*.md"))
         self.assertEqual(len(archives), 1)
 
-    def test_dry_run_no_write(self, ):
+    def test_dry_run_no_write(self):
         content = "# DryRun"
         path = self.mod.write_journal(content, self.tmpdir, dry_run=True)
         self.assertFalse(path.exists())
@@ -817,24 +860,21 @@ class TestWriteJournal(unittest.TestCase):
 
 # ── Test _parse_pheromone_board (feedback loop) ──────────────────────────────
 
-class TestParsePheromoneBoard(unittest.TestCase):
+class TestParsePheromoneBoard(TmpDirTest):
     """Tests pour _parse_pheromone_board — dream lit les phéromones."""
 
+    mod = DREAM
+
     def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
+        super().setUp()
         self.board_dir = self.tmpdir / "_bmad-output"
         self.board_dir.mkdir(parents=True)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-
     def _write_board(self, pheromones):
-        import json
         data = {"version": "1.0.0", "half_life_hours": 168.0,
                 "pheromones": pheromones, "total_emitted": len(pheromones)}
-        (self.board_dir / "pheromone-board.json").write_text(
-            json.dumps(data), encoding="utf-8")
+        (self.board_dir / "pheromone-board.json").write_bytes(
+            json.dumps(data, separators=(",", ":")).encode())
 
     def test_no_board_file(self):
         entries = self.mod._parse_pheromone_board(self.tmpdir)
@@ -931,6 +971,8 @@ class TestParsePheromoneBoard(unittest.TestCase):
         entries = self.mod._parse_pheromone_board(self.tmpdir, since="2025-06-01")
         self.assertEqual(len(entries), 1)
         self.assertIn("New signal", entries[0][1])
+        # Même board, autre since : servi depuis le cache, filtré à nouveau
+        self.assertEqual(len(self.mod._parse_pheromone_board(self.tmpdir)), 2)
 
     def test_collect_sources_includes_stigmergy(self):
         """collect_sources doit inclure le pheromone board comme source."""
@@ -951,23 +993,34 @@ class TestParsePheromoneBoard(unittest.TestCase):
         self.assertIn("stigmergy", kinds)
 
     def test_invalid_json_returns_empty(self):
-        (self.board_dir / "pheromone-board.json").write_text(
-            "not json{", encoding="utf-8")
+        (self.board_dir / "pheromone-board.json").write_bytes(b"not json{")
         entries = self.mod._parse_pheromone_board(self.tmpdir)
         self.assertEqual(entries, [])
 
+    def test_cache_follows_board_changes(self):
+        board = {
+            "pheromone_id": "PH-a", "pheromone_type": "NEED", "location": "src",
+            "text": "First", "emitter": "dev", "timestamp": "2025-06-15T10:00:00+00:00",
+        }
+        self._write_board([board])
+        first = self.mod._parse_pheromone_board(self.tmpdir)
+        self.assertEqual(self.mod._parse_pheromone_board(self.tmpdir), first)
+        self._write_board([dict(board, text="Second, longer")])
+        self.assertIn("Second, longer", self.mod._parse_pheromone_board(self.tmpdir)[0][1])
+
+    def test_undecodable_or_non_object_board_returns_empty(self):
+        for name, raw in [("invalid_utf8", b'{"pheromones": ["\xff"]}'), ("top_level_list", b"[]")]:
+            with self.subTest(name=name):
+                (self.board_dir / "pheromone-board.json").write_bytes(raw)
+                self.assertEqual(self.mod._parse_pheromone_board(self.tmpdir), [])
+
 
 # ── Test timestamp incrémental ────────────────────────────────────────────────
 
-class TestDreamTimestamp(unittest.TestCase):
+class TestDreamTimestamp(TmpDirTest):
     """Tests pour save/read_last_dream_timestamp — mode incrémental."""
 
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    mod = DREAM
 
     def test_no_previous_timestamp(self):
         result = self.mod.read_last_dream_timestamp(self.tmpdir)
@@ -987,25 +1040,28 @@ class TestDreamTimestamp(unittest.TestCase):
         self.mod.save_last_dream_timestamp(deep)
         self.assertTrue((deep / "_bmad" / "_memory" / "dream-last-run").exists())
 
+    def test_overwrite_leaves_only_timestamp(self):
+        self.mod.save_last_dream_timestamp(self.tmpdir)
+        self.mod.save_last_dream_timestamp(self.tmpdir)
+        mem = self.tmpdir / "_bmad" / "_memory"
+        self.assertEqual([p.name for p in mem.iterdir()], ["dream-last-run"])
+        self.assertEqual((mem / "dream-last-run").stat().st_size, 10)
+
     def test_corrupted_file_returns_none(self):
         mem = self.tmpdir / "_bmad" / "_memory"
         mem.mkdir(parents=True)
-        (mem / "dream-last-run").write_text("corrupted", encoding="utf-8")
-        result = self.mod.read_last_dream_timestamp(self.tmpdir)
-        self.assertIsNone(result)
+        for raw in (b"corrupted", b"\xff\xfe2026-01-0"):
+            with self.subTest(raw=raw):
+                (mem / "dream-last-run").write_bytes(raw)
+                self.assertIsNone(self.mod.read_last_dream_timestamp(self.tmpdir))
 
 
 # ── Test dream_quick ──────────────────────────────────────────────────────────
 
-class TestDreamQuick(unittest.TestCase):
+class TestDreamQuick(TmpDirTest):
     """Tests pour dream_quick() — mode rapide O(n)."""
 
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    mod = DREAM
 
     def test_returns_empty_no_sources(self):
         result = self.mod.dream_quick(self.tmpdir)
@@ -1015,29 +1071,19 @@ class TestDreamQuick(unittest.TestCase):
         _create_memory_tree(
             self.tmpdir,
             learnings={
-                "dev.md": (
-                    "- [2025-06-01] TODO: refactor caching layer\n"
-                    "- [2025-06-02] caching improved performance database\n"
-                    "- [2025-06-03] caching invalidation still problematic\n"
-                ),
+                "dev.md": _FIXTURE_DEV_CACHING,
             },
-            decisions=(
-                "- [2025-06-01] Implemented caching strategy database layer\n"
-            ),
+            decisions=_FIXTURE_CACHING_DECISION,
         )
         insights = self.mod.dream_quick(self.tmpdir)
         # May return 0 if data not rich enough, but function must not crash
         self.assertIsInstance(insights, list)
 
     def test_respects_quick_max(self):
-        entries = "\n".join(
-            f"- [2025-06-{i:02d}] TODO: refactor item {i} needs improvement"
-            for i in range(1, 25)
-        )
         _create_memory_tree(
             self.tmpdir,
-            learnings={"dev.md": entries},
-            decisions=entries.replace("TODO:", "Decided:"),
+            learnings={"dev.md": _FIXTURE_TODO_ITEMS},
+            decisions=_FIXTURE_DECIDED_ITEMS,
         )
         insights = self.mod.dream_quick(self.tmpdir)
         self.assertLessEqual(len(insights), self.mod.QUICK_MAX_INSIGHTS)
@@ -1119,15 +1165,10 @@ class TestDreamQuick(unittest.TestCase):
 
 # ── Test dream(quick=True) parameter ─────────────────────────────────────────
 
-class TestDreamQuickParam(unittest.TestCase):
+class TestDreamQuickParam(TmpDirTest):
     """Tests que dream() avec quick=True produit le même résultat que dream_quick."""
 
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    mod = DREAM
 
     def test_quick_param_no_crash(self):
         _create_memory_tree(
@@ -1148,15 +1189,9 @@ class TestDreamQuickParam(unittest.TestCase):
         _create_memory_tree(
             self.tmpdir,
             learnings={
-                "dev.md": (
-                    "- [2025-06-01] TODO: refactor caching layer\n"
-                    "- [2025-06-02] caching improved performance database\n"
-                    "- [2025-06-03] caching invalidation still problematic\n"
-                ),
+                "dev.md": _FIXTURE_DEV_CACHING,
             },
-            decisions=(
-                "- [2025-06-01] Implemented caching strategy database layer\n"
-            ),
+            decisions=_FIXTURE_CACHING_DECISION,
         )
         via_param = self.mod.dream(self.tmpdir, quick=True)
         via_func = self.mod.dream_quick(self.tmpdir)
@@ -1178,12 +1213,28 @@ class TestDreamQuickParam(unittest.TestCase):
         insights = self.mod.dream(self.tmpdir, _sources=sources)
         self.assertIsInstance(insights, list)
 
+    def test_quick_with_sources_skips_collection(self):
+        """dream(quick=True, _sources=...) ne doit pas relire le disque."""
+        _create_memory_tree(
+            self.tmpdir,
+            learnings={
+                "dev.md": _FIXTURE_DEV_CACHING,
+            },
+            decisions=_FIXTURE_CACHING_DECISION,
+        )
+        sources = self.mod.collect_sources(self.tmpdir)
+        expected = self.mod.dream(self.tmpdir, quick=True, _sources=sources)
+        missing = self.tmpdir / "absent"
+        insights = self.mod.dream(missing, quick=True, _sources=sources)
+        self.assertEqual(
+            [i.title for i in insights], [i.title for i in expected],
+        )
+
 
 # ── Test _INSIGHT_TO_PHEROMONE mapping ────────────────────────────────────────
 
 class TestInsightToPheromone(unittest.TestCase):
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_mapping_keys(self):
         mapping = self.mod._INSIGHT_TO_PHEROMONE
@@ -1201,18 +1252,17 @@ class TestInsightToPheromone(unittest.TestCase):
 
 # ── Test emit_to_stigmergy ───────────────────────────────────────────────────
 
-class TestEmitToStigmergy(unittest.TestCase):
+class TestEmitToStigmergy(TmpDirTest):
     """Tests pour emit_to_stigmergy() — bridge dream → stigmergy."""
 
+    mod = DREAM
+    sg = importlib.import_module("stigmergy")
+
     def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
+        super().setUp()
         # Créer le dossier _bmad-output pour le board stigmergy
         (self.tmpdir / "_bmad-output").mkdir(parents=True, exist_ok=True)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-
     def test_returns_zero_empty_list(self):
         count = self.mod.emit_to_stigmergy([], self.tmpdir)
         self.assertEqual(count, 0)
@@ -1265,8 +1315,7 @@ class TestEmitToStigmergy(unittest.TestCase):
         self.mod.emit_to_stigmergy(insights, self.tmpdir)
 
         # Load board and check text prefix
-        sg = importlib.import_module("stigmergy")
-        board = sg.load_board(self.tmpdir)
+        board = self.sg.load_board(self.tmpdir)
         self.assertTrue(len(board.pheromones) > 0)
         for p in board.pheromones:
             self.assertTrue(p.text.startswith("[dream]"))
@@ -1283,8 +1332,7 @@ class TestEmitToStigmergy(unittest.TestCase):
         ]
         self.mod.emit_to_stigmergy(insights, self.tmpdir)
 
-        sg = importlib.import_module("stigmergy")
-        board = sg.load_board(self.tmpdir)
+        board = self.sg.load_board(self.tmpdir)
         for p in board.pheromones:
             self.assertIn("auto-dream", p.tags)
 
@@ -1300,40 +1348,35 @@ class TestEmitToStigmergy(unittest.TestCase):
         ]
         self.mod.emit_to_stigmergy(insights, self.tmpdir)
 
-        sg = importlib.import_module("stigmergy")
-        board = sg.load_board(self.tmpdir)
+        board = self.sg.load_board(self.tmpdir)
         for p in board.pheromones:
             self.assertLessEqual(p.intensity, 0.9)
 
     def test_category_to_pheromone_type(self):
         """Chaque catégorie d'insight doit mapper vers le bon type phéromone."""
-        sg = importlib.import_module("stigmergy")
         for category, expected_type in self.mod._INSIGHT_TO_PHEROMONE.items():
-            # Fresh tmpdir per iteration to avoid accumulated state
-            cat_dir = Path(tempfile.mkdtemp())
-            (cat_dir / "_bmad-output").mkdir(parents=True, exist_ok=True)
-            try:
-                insights = [
-                    self.mod.DreamInsight(
-                        title=f"Test {category}",
-                        description=f"Testing {category} mapping",
-                        sources=["dev.md"],
-                        category=category,
-                        confidence=0.6,
-                    ),
-                ]
-                count = self.mod.emit_to_stigmergy(insights, cat_dir)
-                self.assertGreater(count, 0,
-                                   f"emit should succeed for {category}")
-
-                board = sg.load_board(cat_dir)
-                self.assertTrue(len(board.pheromones) > 0,
-                                f"board should have pheromones for {category}")
-                last = board.pheromones[-1]
-                self.assertEqual(last.pheromone_type, expected_type,
-                                 f"{category} should map to {expected_type}")
-            finally:
-                shutil.rmtree(cat_dir, ignore_errors=True)
+            # Sous-dossier neuf par itération pour éviter l'état accumulé
+            cat_dir = self.tmpdir / category
+            (cat_dir / "_bmad-output").mkdir(parents=True)
+            insights = [
+                self.mod.DreamInsight(
+                    title=f"Test {category}",
+                    description=f"Testing {category} mapping",
+                    sources=["dev.md"],
+                    category=category,
+                    confidence=0.6,
+                ),
+            ]
+            count = self.mod.emit_to_stigmergy(insights, cat_dir)
+            self.assertGreater(count, 0,
+                               f"emit should succeed for {category}")
+
+            board = self.sg.load_board(cat_dir)
+            self.assertTrue(len(board.pheromones) > 0,
+                            f"board should have pheromones for {category}")
+            last = board.pheromones[-1]
+            self.assertEqual(last.pheromone_type, expected_type,
+                             f"{category} should map to {expected_type}")
 
     def test_unknown_category_defaults_to_need(self):
         insights = [
@@ -1347,8 +1390,7 @@ class TestEmitToStigmergy(unittest.TestCase):
         ]
         self.mod.emit_to_stigmergy(insights, self.tmpdir)
 
-        sg = importlib.import_module("stigmergy")
-        board = sg.load_board(self.tmpdir)
+        board = self.sg.load_board(self.tmpdir)
         self.assertEqual(board.pheromones[-1].pheromone_type, "NEED")
 
     def test_dedup_cross_session(self):
@@ -1367,8 +1409,7 @@ class TestEmitToStigmergy(unittest.TestCase):
         self.assertEqual(count1, 1)
         self.assertEqual(count2, 0, "Second emit should be deduplicated")
 
-        sg = importlib.import_module("stigmergy")
-        board = sg.load_board(self.tmpdir)
+        board = self.sg.load_board(self.tmpdir)
         dream_pheromones = [p for p in board.pheromones
                             if p.text.startswith("[dream]")]
         self.assertEqual(len(dream_pheromones), 1)
@@ -1388,8 +1429,7 @@ class TestEmitToStigmergy(unittest.TestCase):
         self.assertEqual(count1, 1)
         self.assertEqual(count2, 1)
 
-        sg = importlib.import_module("stigmergy")
-        board = sg.load_board(self.tmpdir)
+        board = self.sg.load_board(self.tmpdir)
         self.assertEqual(len(board.pheromones), 2)
 
 
@@ -1397,12 +1437,12 @@ class TestEmitToStigmergy(unittest.TestCase):
 
 class TestQuickMaxInsights(unittest.TestCase):
     def test_constant_is_positive_int(self):
-        mod = _import_dream()
+        mod = DREAM
         self.assertIsInstance(mod.QUICK_MAX_INSIGHTS, int)
         self.assertGreater(mod.QUICK_MAX_INSIGHTS, 0)
 
     def test_quick_max_less_than_max(self):
-        mod = _import_dream()
+        mod = DREAM
         self.assertLess(mod.QUICK_MAX_INSIGHTS, mod.MAX_INSIGHTS)
 
 
@@ -1411,8 +1451,7 @@ class TestQuickMaxInsights(unittest.TestCase):
 class TestBigramKeywords(unittest.TestCase):
     """Vérifie que _extract_keywords retourne aussi des bigrams."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_returns_unigrams(self):
         kw = self.mod._extract_keywords("API design pattern")
@@ -1467,8 +1506,9 @@ class TestBigramKeywords(unittest.TestCase):
 class TestTemporalWeight(unittest.TestCase):
     """Vérifie la pondération temporelle des entrées."""
 
+    mod = DREAM
+
     def setUp(self):
-        self.mod = _import_dream()
         self.now = datetime(2026, 2, 28)
 
     def test_today_returns_one(self):
@@ -1516,8 +1556,9 @@ class TestTemporalWeight(unittest.TestCase):
 class TestApplyTemporalDecay(unittest.TestCase):
     """Vérifie que apply_temporal_decay modifie les confidences."""
 
+    mod = DREAM
+
     def setUp(self):
-        self.mod = _import_dream()
         self.now = datetime(2026, 2, 28)
 
     def test_recent_entries_minimal_decay(self):
@@ -1590,8 +1631,7 @@ class TestApplyTemporalDecay(unittest.TestCase):
 class TestInsightSignature(unittest.TestCase):
     """Vérifie la signature stable des insights."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_same_insight_same_signature(self):
         ins = self.mod.DreamInsight(
@@ -1602,6 +1642,15 @@ class TestInsightSignature(unittest.TestCase):
         sig2 = self.mod._insight_signature(ins)
         self.assertEqual(sig1, sig2)
 
+    def test_signature_format_is_stable(self):
+        """Le format est persisté dans dream-memory.json : il ne doit pas changer."""
+        ins = self.mod.DreamInsight(
+            title="Connexion learnings ↔ décisions (2x)", description="desc",
+            sources=["a.md"], category="connection", confidence=0.5,
+        )
+        self.assertEqual(self.mod._insight_signature(ins),
+                         "connection:connexionlearningsdcisions2x")
+
     def test_different_description_same_signature(self):
         """La signature ne dépend pas de la description."""
         ins1 = self.mod.DreamInsight(
@@ -1643,17 +1692,15 @@ class TestInsightSignature(unittest.TestCase):
         self.assertTrue(after_colon.isalnum())
 
 
-class TestDreamMemoryPersistence(unittest.TestCase):
+class TestDreamMemoryPersistence(TmpDirTest):
     """Vérifie le load/save de dream-memory.json."""
 
+    mod = DREAM
+
     def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
+        super().setUp()
         (self.tmpdir / "_bmad-output").mkdir(parents=True, exist_ok=True)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-
     def test_load_empty(self):
         mem = self.mod.load_dream_memory(self.tmpdir)
         self.assertEqual(mem, {})
@@ -1667,7 +1714,7 @@ class TestDreamMemoryPersistence(unittest.TestCase):
 
     def test_corrupted_file_returns_empty(self):
         mem_path = self.tmpdir / "_bmad-output" / self.mod.DREAM_MEMORY_FILE
-        mem_path.write_text("not json!", encoding="utf-8")
+        mem_path.write_bytes(b"not json!")
         mem = self.mod.load_dream_memory(self.tmpdir)
         self.assertEqual(mem, {})
 
@@ -1675,8 +1722,7 @@ class TestDreamMemoryPersistence(unittest.TestCase):
 class TestUpdateDreamMemory(unittest.TestCase):
     """Vérifie la logique de mise à jour de la mémoire dream."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def _make_insight(self, title, category="pattern"):
         return self.mod.DreamInsight(
@@ -1684,6 +1730,9 @@ class TestUpdateDreamMemory(unittest.TestCase):
             sources=["a.md"], category=category, confidence=0.6,
         )
 
+    def _signature(self, title, category="pattern"):
+        return self.mod._insight_signature(self._make_insight(title, category))
+
     def test_first_dream_all_new(self):
         memory = {}
         insights = [self._make_insight("Alpha"), self._make_insight("Beta")]
@@ -1764,10 +1813,11 @@ class TestUpdateDreamMemory(unittest.TestCase):
 
     def test_seen_count_increments(self):
         memory = {}
+        alpha = self._make_insight("Alpha")
         for _ in range(5):
-            self.mod.update_dream_memory([self._make_insight("Alpha")], memory)
+            self.mod.update_dream_memory([alpha], memory)
 
-        sig = self.mod._insight_signature(self._make_insight("Alpha"))
+        sig = self._signature("Alpha")
         self.assertEqual(memory["insights"][sig]["seen_count"], 5)
 
     def test_stale_flag_set(self):
@@ -1778,7 +1828,7 @@ class TestUpdateDreamMemory(unittest.TestCase):
         # Second dream without Alpha
         self.mod.update_dream_memory([self._make_insight("Beta")], memory)
 
-        sig_alpha = self.mod._insight_signature(self._make_insight("Alpha"))
+        sig_alpha = self._signature("Alpha")
         self.assertTrue(memory["insights"][sig_alpha].get("stale", False))
 
 
@@ -1787,12 +1837,8 @@ class TestUpdateDreamMemory(unittest.TestCase):
 class TestRenderJournalDreamDiff(unittest.TestCase):
     """Vérifie que le journal inclut la section Dream Diff."""
 
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    mod = DREAM
+    root = Path("absent-project")  # render_journal ne touche pas au disque
 
     def test_no_diff_no_section(self):
         ins = [self.mod.DreamInsight(
@@ -1801,7 +1847,7 @@ class TestRenderJournalDreamDiff(unittest.TestCase):
         )]
         src = [self.mod.DreamSource(name="a.md", kind="learnings",
                                      entries=["e"])]
-        journal = self.mod.render_journal(ins, src, self.tmpdir)
+        journal = self.mod.render_journal(ins, src, self.root)
         self.assertNotIn("Dream Diff", journal)
 
     def test_diff_with_persistent(self):
@@ -1812,7 +1858,7 @@ class TestRenderJournalDreamDiff(unittest.TestCase):
         src = [self.mod.DreamSource(name="a.md", kind="learnings",
                                      entries=["e"])]
         diff = {"new": [], "persistent": ins, "resolved": []}
-        journal = self.mod.render_journal(ins, src, self.tmpdir,
+        journal = self.mod.render_journal(ins, src, self.root,
                                            dream_diff=diff)
         self.assertIn("Dream Diff", journal)
         self.assertIn("Persistants", journal)
@@ -1827,7 +1873,7 @@ class TestRenderJournalDreamDiff(unittest.TestCase):
                                      entries=["e"])]
         diff = {"new": ins, "persistent": [],
                 "resolved": ["pattern:oldinsight"]}
-        journal = self.mod.render_journal(ins, src, self.tmpdir,
+        journal = self.mod.render_journal(ins, src, self.root,
                                            dream_diff=diff)
         self.assertIn("Nouveaux", journal)
         self.assertIn("Résolus", journal)
@@ -1839,12 +1885,18 @@ class TestRenderJournalDreamDiff(unittest.TestCase):
 class TestExtractAgents(unittest.TestCase):
     """Vérifie l'extraction d'agents depuis le texte."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_known_agents_is_frozenset(self):
         self.assertIsInstance(self.mod._KNOWN_AGENTS, frozenset)
 
+    def test_patterns_compiled_at_module_level(self):
+        for name in ("_DATE_PATTERN", "_TRACE_PATTERN", "_WORD_PATTERN",
+                     "_AGENT_PATTERN", "_LEARNINGS_FILE_PATTERN",
+                     "_NON_ALNUM_PATTERN"):
+            with self.subTest(name=name):
+                self.assertIsInstance(getattr(self.mod, name), re.Pattern)
+
     def test_known_agents_contains_expected(self):
         for agent in ("dev", "architect", "pm", "qa", "sm", "analyst",
                        "tech-writer", "ux-designer", "bmad-master"):
@@ -1894,8 +1946,7 @@ class TestExtractAgents(unittest.TestCase):
 class TestAgentAttribution(unittest.TestCase):
     """Vérifie que les insights contiennent agents_relevant."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_cross_connection_populates_agents(self):
         src_a = self.mod.DreamSource(
@@ -1971,8 +2022,7 @@ class TestAgentAttribution(unittest.TestCase):
 class TestOpportunityCap(unittest.TestCase):
     """Vérifie le plafond d'opportunités par source."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_cap_limits_per_source(self):
         """A source with many TODOs should be capped at MAX_OPPORTUNITIES_PER_SOURCE."""
@@ -2011,8 +2061,7 @@ class TestOpportunityCap(unittest.TestCase):
 class TestBigramScoring(unittest.TestCase):
     """Vérifie que les bigrams ont un score plus élevé que les unigrams."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_bigram_higher_base_confidence(self):
         """Bigram patterns should start at higher confidence than unigrams."""
@@ -2064,8 +2113,7 @@ class TestBigramScoring(unittest.TestCase):
 class TestTensionMarkerFix(unittest.TestCase):
     """Vérifie que 'never'/'jamais' ne créent pas de tensions fantômes."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_never_only_positive(self):
         """Entry with 'never' should appear in positive only, not negative."""
@@ -2126,15 +2174,10 @@ class TestTensionMarkerFix(unittest.TestCase):
 
 # ── Test Render Journal Agents ────────────────────────────────────────────────
 
-class TestRenderJournalAgents(unittest.TestCase):
+class TestRenderJournalAgents(TmpDirTest):
     """Vérifie que le journal affiche les agents pertinents."""
 
-    def setUp(self):
-        self.mod = _import_dream()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    mod = DREAM
 
     def test_agents_displayed(self):
         ins = [self.mod.DreamInsight(
@@ -2166,8 +2209,7 @@ class TestRenderJournalAgents(unittest.TestCase):
 class TestJsonOutputStructure(unittest.TestCase):
     """Vérifie la structure enrichie de la sortie JSON."""
 
-    def setUp(self):
-        self.mod = _import_dream()
+    mod = DREAM
 
     def test_insight_has_agents_relevant(self):
         """DreamInsight serialized as dict should include agents_relevant."""
@@ -2,7 +2,6 @@
 
 import importlib.util
 import os
-import shutil
 import sys
 import tempfile
 import unittest
@@ -19,11 +18,32 @@ def _import_gen():
     return mod
 
 
+# Loaded once per process, shared by every TestCase
+GEN = _import_gen()
+
+# RAM-backed (tmpfs) fixtures when /dev/shm is available, system tmpdir otherwise
+_SHM_DIR = "/dev/shm"
+FIXTURE_ROOT = _SHM_DIR if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK) else None
+
+
+class TmpDirTest(unittest.TestCase):
+    """One tmpdir per class; each test works in its own subdirectory."""
+
+    @classmethod
+    def setUpClass(cls):
+        tmp = tempfile.TemporaryDirectory(prefix="bmad-", dir=FIXTURE_ROOT)
+        cls.addClassCleanup(tmp.cleanup)
+        cls._root = Path(tmp.name)
+
+    def setUp(self):
+        self.tmpdir = self._root / self._testMethodName
+        self.tmpdir.mkdir()
+
+
 class TestToSnake(unittest.TestCase):
     """Test to_snake() utility."""
 
-    def setUp(self):
-        self.gen = _import_gen()
+    gen = GEN
 
     def test_basic(self):
         self.assertEqual(self.gen.to_snake("Hello World"), "hello_world")
@@ -45,8 +65,7 @@ class TestToSnake(unittest.TestCase):
 class TestToPascal(unittest.TestCase):
     """Test to_pascal() utility."""
 
-    def setUp(self):
-        self.gen = _import_gen()
+    gen = GEN
 
     def test_basic(self):
         self.assertEqual(self.gen.to_pascal("hello world"), "HelloWorld")
@@ -59,15 +78,10 @@ class TestToPascal(unittest.TestCase):
         self.assertLessEqual(len(result), 60)
 
 
-class TestLoadDna(unittest.TestCase):
+class TestLoadDna(TmpDirTest):
     """Test load_dna()."""
 
-    def setUp(self):
-        self.gen = _import_gen()
-        self.tmpdir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    gen = GEN
 
     def test_valid_yaml(self):
         f = self.tmpdir / "test.dna.yaml"
@@ -89,8 +103,7 @@ class TestLoadDna(unittest.TestCase):
 class TestExtractAcItems(unittest.TestCase):
     """Test extract_ac_items() from various DNA structures."""
 
-    def setUp(self):
-        self.gen = _import_gen()
+    gen = GEN
 
     def test_empty_dna(self):
         items = self.gen.extract_ac_items({})
@@ -159,12 +172,13 @@ class TestExtractAcItems(unittest.TestCase):
         self.assertEqual(items[0]["enforcement"], "soft")
 
 
-class TestGenerateTests(unittest.TestCase):
+class TestGenerateTests(TmpDirTest):
     """Test generate_tests() for all supported frameworks."""
 
+    gen = GEN
+
     def setUp(self):
-        self.gen = _import_gen()
-        self.tmpdir = Path(tempfile.mkdtemp())
+        super().setUp()
         self.dna = {
             "name": "test-archetype",
             "version": "1.0.0",
@@ -180,9 +194,6 @@ class TestGenerateTests(unittest.TestCase):
             ],
         }
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-
     def test_pytest_generates_py_files(self):
         files = self.gen.generate_tests(self.dna, "pytest", str(self.tmpdir), "test.dna.yaml")
         self.assertEqual(len(files), 1)
@@ -254,8 +265,7 @@ class TestGenerateTests(unittest.TestCase):
 class TestTemplates(unittest.TestCase):
     """Test TEMPLATES structure."""
 
-    def setUp(self):
-        self.gen = _import_gen()
+    gen = GEN
 
     def test_all_templates_have_ext(self):
         for name, tmpl in self.gen.TEMPLATES.items():